@@ -29,10 +29,14 @@ setup(
         "uvicorn[standard]>=0.34.0",
         "pydantic>=2.0.0",
         "httpx>=0.27.0",
-        "aiofiles>=23.2.0",
         "python-docx>=1.2.0",
+        "pypdfium2>=4.30.0",
         "PyPDF2>=3.0.0",
+        "charset-normalizer>=3.0.0",
+        "watchfiles>=0.21.0",
         "python-multipart>=0.0.9",  # Required for file uploads
+        "cachetools>=5.3.0",
+        "orjson>=3.9.0",
     ],
 
     # Development dependencies
@@ -19,34 +19,50 @@ Version: 0.1.0
 """
 
 from fastapi.middleware.gzip import GZipMiddleware
-from datetime import datetime, timedelta
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from cachetools import TTLCache, cached
 from pathlib import Path
 import os
-from fastapi import FastAPI, Depends, Request, UploadFile, File, Form
+from fastapi import (
+    FastAPI, Depends, HTTPException, Request, Response, UploadFile, File, Form,
+    Query
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from openai import OpenAIError
+from fastapi.responses import StreamingResponse
+from openai import OpenAI, OpenAIError
 from .models import (
     EmailRewriteRequest, EmailRewriteResponse, HealthResponse,
     ApiError, ValidationError, ApiConfig,
     DetailedApiError, ErrorCode, DetailedApiException
 )
 from .exceptions import TokenLimitError, APIRateLimitError
-from services import EmailService, EmailServiceInterface
+from .rate_limiter import RateLimiter
+from .responses import ORJSONResponse
+from .upload_limit import UploadSizeLimitMiddleware
+from services import (
+    EmailService, EmailServiceInterface, ResponseCache, RewriteResult,
+    SemanticCache
+)
 from utils import (
     load_environment,
     CustomLogger,
 )
 from utils.file_handler import (
     extract_text_from_file, validate_file_type, validate_file_size,
-    get_file_mime_type, save_output_file
+    get_file_mime_type, save_output_file, scan_input_folder
 )
 from utils.input_folder_monitor import InputFolderMonitor, get_folder_stats
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from asyncio import Lock
-import uuid
+import secrets
+import orjson
 import mimetypes
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from config.production import ProductionSettings
 
 # ==================== INITIALIZATION ====================
@@ -61,13 +77,49 @@ api_config = ApiConfig()
 if ProductionSettings.is_production():
     ProductionSettings.validate()
 
+# ==================== TIMESTAMPS ====================
+
+# Response metadata timestamps are refreshed in the background instead of
+# formatting the current time on every request
+TIMESTAMP_REFRESH_SECONDS = 0.25
+
+
+def format_timestamp() -> str:
+    """Format the current UTC time for response metadata."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+current_timestamp = format_timestamp()
+
+
+async def refresh_timestamp() -> None:
+    """Keep current_timestamp up to date while the app is running."""
+    global current_timestamp
+    while True:
+        await asyncio.sleep(TIMESTAMP_REFRESH_SECONDS)
+        current_timestamp = format_timestamp()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background tasks for the lifetime of the app."""
+    global current_timestamp
+    current_timestamp = format_timestamp()
+    task = asyncio.create_task(refresh_timestamp())
+    try:
+        yield
+    finally:
+        task.cancel()
+
 # ==================== FASTAPI APP SETUP ====================
 
 app = FastAPI(
     title="Email Rewriter API",
     description="API for rewriting emails using OpenAI GPT with support for multiple input formats",
     version="0.1.0",
-    debug=not ProductionSettings.is_production()
+    debug=not ProductionSettings.is_production(),
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add trusted host middleware for production security
@@ -80,6 +132,17 @@ if ProductionSettings.is_production():
             allowed_hosts=ProductionSettings.ALLOWED_HOSTS
         )
 
+# Largest upload request body: the 10MB file limit plus multipart overhead
+UPLOAD_REQUEST_MAX_BYTES = 10 * 1024 * 1024 + 64 * 1024
+
+# Reject oversized uploads early; added before CORS so it runs inside it and
+# its 413 still carries the CORS headers
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/rewrite-upload",
+    max_bytes=UPLOAD_REQUEST_MAX_BYTES
+)
+
 # Configure CORS middleware for cross-origin requests
 app.add_middleware(
     CORSMiddleware,
@@ -90,10 +153,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add GZip compression middleware for response compression
+# Add GZip compression middleware for responses larger than 1KB
 app.add_middleware(
     GZipMiddleware,
-    minimum_size=api_config.max_request_size
+    minimum_size=1024,
+    compresslevel=6
 )
 
 # ==================== LOGGING AND MONITORING ====================
@@ -111,21 +175,205 @@ OUTPUT_DIR = BASE_DIR / "data" / "output"
 # Initialize input folder monitor for batch processing
 input_monitor = InputFolderMonitor(INPUT_DIR, OUTPUT_DIR)
 
+# Thread pool for CPU-bound text extraction (PDF/DOCX parsing)
+EXTRACTION_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="extract")
+
+# Maximum number of input folder files rewritten concurrently
+INPUT_FOLDER_CONCURRENCY = int(os.getenv("INPUT_FOLDER_CONCURRENCY", "5"))
+
+# Small input folder files are rewritten together in one OpenAI request
+INPUT_FOLDER_BATCH_SIZE = 5
+INPUT_FOLDER_BATCH_TOKENS = 3000
+
 # ==================== DEPENDENCY INJECTION ====================
 
 
+@lru_cache(maxsize=1)
 def get_email_service() -> EmailServiceInterface:
     """
     Dependency injection function to provide EmailService instance.
 
+    The service is created once per process so every request shares its
+    OpenAI client and connection pool.
+
     Returns:
         EmailServiceInterface: Instance of the email rewriting service
     """
     return EmailService()
 
 
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Get the OpenAI client used for health checks, created once per process.
+
+    Returns:
+        OpenAI: Configured OpenAI client
+    """
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+# ==================== RATE LIMITING ====================
+
+# Per-client token bucket; requests over the limit fail at once. Buckets live
+# in each worker process, so the limit applies per worker
+rate_limiter = RateLimiter(
+    requests=int(os.getenv("RATE_LIMIT_REQUESTS", "10")),
+    period=int(os.getenv("RATE_LIMIT_PERIOD", "60"))
+)
+
+
+async def enforce_rate_limit(request: Request) -> None:
+    """
+    Dependency that applies the per-client rate limit.
+
+    Args:
+        request: Incoming request, keyed by client host
+
+    Raises:
+        HTTPException: 429 with a Retry-After header if the client has no
+            request token left
+    """
+    client_host = request.client.host if request.client else "unknown"
+    try:
+        rate_limiter.acquire(client_host)
+    except APIRateLimitError as e:
+        logger.warning(f"Rate limit exceeded for {client_host}")
+        headers = ({"Retry-After": str(e.retry_after)}
+                   if e.retry_after is not None else None)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error_code": ErrorCode.RATE_LIMIT_EXCEEDED.value,
+                "message": e.message,
+                "retry_after": e.retry_after,
+                "suggestion": "Reduce request frequency and retry later"
+            },
+            headers=headers
+        )
+
+
+# ==================== RESPONSE CACHING ====================
+
+# Exact-match cache for repeated rewrite requests (first tier)
+response_cache = ResponseCache()
+
+# Semantic cache for near-duplicate rewrite requests (opt-in via env)
+semantic_cache = SemanticCache()
+
+
+def served_from_cache(result: RewriteResult) -> RewriteResult:
+    """
+    Get a cached result as served: no OpenAI call was made, so it reports
+    no tokens and no cost.
+
+    Args:
+        result: Result stored when the rewrite was first generated
+
+    Returns:
+        RewriteResult with the cached content and zero usage
+    """
+    return result._replace(
+        total_tokens=0, input_tokens=0, output_tokens=0, cost_usd=0.0)
+
+
+async def rewrite_with_cache(
+    email_service: EmailServiceInterface,
+    use_cache: bool,
+    email_text: str,
+    target_audience: str,
+    tone: str,
+    focus_areas: Optional[List[str]] = None,
+    additional_instructions: Optional[str] = None
+) -> Tuple[RewriteResult, str]:
+    """
+    Rewrite an email, serving repeated requests from the cache.
+
+    Exact matches are checked first so they skip the embedding call of the
+    semantic tier; near-duplicates are then looked up semantically.
+
+    Args:
+        email_service: Email service used on a cache miss
+        use_cache: False to bypass the cache for sensitive content
+        email_text: Original email content
+        target_audience: Description of target audience or context
+        tone: Desired tone
+        focus_areas: Optional list of areas to emphasize
+        additional_instructions: Optional specific instructions
+
+    Returns:
+        Tuple of (email service result, cache status: hit, miss or bypass).
+        Hits report zero tokens and cost.
+    """
+    if not use_cache:
+        result = await email_service.rewrite_email(
+            email_text=email_text,
+            target_audience=target_audience,
+            tone=tone,
+            focus_areas=focus_areas,
+            additional_instructions=additional_instructions
+        )
+        return result, "bypass"
+
+    model = getattr(email_service, "model", "")
+    key = ResponseCache.key(
+        email_text, target_audience, tone, focus_areas,
+        additional_instructions, model
+    )
+    cached = await response_cache.get(key)
+    if cached is not None:
+        return served_from_cache(cached), "hit"
+
+    namespace = SemanticCache.namespace(
+        target_audience, tone, focus_areas, additional_instructions, model
+    )
+    cached, embedding = await semantic_cache.lookup(namespace, email_text)
+    if cached is not None:
+        await response_cache.set(key, cached)
+        return served_from_cache(cached), "hit"
+
+    result = await email_service.rewrite_email(
+        email_text=email_text,
+        target_audience=target_audience,
+        tone=tone,
+        focus_areas=focus_areas,
+        additional_instructions=additional_instructions
+    )
+    await response_cache.set(key, result)
+    await semantic_cache.store(namespace, embedding, result)
+    return result, "miss"
+
+
+@cached(TTLCache(maxsize=2, ttl=5))
+def get_cached_folder_stats(folder_path: Path) -> dict:
+    """
+    Get folder statistics, reusing results for 5 seconds.
+
+    Monitoring dashboards poll /folder-stats frequently; the cache keeps
+    each poll from re-walking and stat-ing every file in the folder.
+
+    Args:
+        folder_path: Path to folder
+
+    Returns:
+        Dict with folder statistics
+    """
+    return get_folder_stats(folder_path)
+
+
 # ==================== HEALTH CHECK ENDPOINTS ====================
 
+# Dependency status payloads reported by /health
+HEALTHY_DEPENDENCIES = {"openai": "connected", "file_system": "ok"}
+DEGRADED_DEPENDENCIES = {"openai": "error", "file_system": "ok"}
+UNHEALTHY_DEPENDENCIES = {"openai": "error", "file_system": "unknown"}
+
+# Seconds a rendered /health response is reused, and the cached
+# (monotonic timestamp, response body) pair
+HEALTH_CACHE_SECONDS = 1.0
+health_cache: Optional[Tuple[float, bytes]] = None
+
 
 @app.get("/ping")
 async def ping():
@@ -138,11 +386,9 @@ async def ping():
     return {"ping": "pong"}
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health():
+def check_health() -> HealthResponse:
     """
-    Enhanced health check endpoint for production monitoring.
-    Checks OpenAI API connectivity and system status.
+    Check OpenAI client configuration and build the health status.
 
     Returns:
         HealthResponse: Detailed health status including dependencies
@@ -151,8 +397,7 @@ async def health():
 
     try:
         # Check OpenAI connection (lightweight test)
-        import openai
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
 
         # Just verify the client is configured (doesn't make API call)
         api_key_valid = bool(
@@ -165,10 +410,7 @@ async def health():
             version="0.1.0",
             uptime=time.time() - start_time,
             message=f"Service is {status}",
-            dependencies={
-                "openai": "connected" if api_key_valid else "error",
-                "file_system": "ok"
-            }
+            dependencies=HEALTHY_DEPENDENCIES if api_key_valid else DEGRADED_DEPENDENCIES
         )
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -177,21 +419,43 @@ async def health():
             version="0.1.0",
             uptime=time.time() - start_time,
             message=f"Health check failed: {str(e)}",
-            dependencies={
-                "openai": "error",
-                "file_system": "unknown"
-            }
+            dependencies=UNHEALTHY_DEPENDENCIES
         )
 
+
+@app.get("/health", response_model=HealthResponse)
+async def health():
+    """
+    Enhanced health check endpoint for production monitoring.
+    Checks OpenAI API connectivity and system status.
+
+    Load balancer probes arrive every second or so, so the rendered
+    response is reused for HEALTH_CACHE_SECONDS.
+
+    Returns:
+        HealthResponse: Detailed health status including dependencies
+    """
+    global health_cache
+
+    now = time.monotonic()
+    if health_cache is None or now - health_cache[0] >= HEALTH_CACHE_SECONDS:
+        body = ORJSONResponse(content=check_health().model_dump()).body
+        health_cache = (now, body)
+
+    return Response(content=health_cache[1], media_type="application/json")
+
 # ==================== API ENDPOINTS ====================
 # After the health endpoint (around line 186), add these endpoints:
 
 # ==================== EMAIL REWRITING ENDPOINTS ====================
 
 
-@app.post("/rewrite", response_model=EmailRewriteResponse)
+@app.post("/rewrite", response_model=EmailRewriteResponse,
+          dependencies=[Depends(enforce_rate_limit)])
 async def rewrite_email(
     request: EmailRewriteRequest,
+    cache: bool = Query(
+        default=True, description="Set to false to bypass the response cache"),
     email_service: EmailServiceInterface = Depends(get_email_service)
 ):
     """
@@ -201,6 +465,7 @@ async def rewrite_email(
 
     Args:
         request: EmailRewriteRequest containing email text and parameters
+        cache: Whether the response cache may be used for this request
         email_service: Injected email service instance
 
     Returns:
@@ -216,14 +481,16 @@ async def rewrite_email(
         }
         ```
     """
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
     start_time = time.time()
 
     try:
         logger.info(f"[{request_id}] → Processing email rewrite...")
 
-        # Call the email service to rewrite
-        result = await email_service.rewrite_email(
+        # Call the email service to rewrite (or serve from cache)
+        result, cache_status = await rewrite_with_cache(
+            email_service,
+            cache,
             email_text=request.email_text,
             target_audience=request.target_audience,
             tone=request.tone,
@@ -232,27 +499,29 @@ async def rewrite_email(
         )
 
         processing_time = time.time() - start_time
-        cost = result.get('usage', {}).get('cost_usd', 0)
+        cost = result.cost_usd
 
         logger.info(
             f"[{request_id}] ✓ Email rewritten | "
             f"Time: {processing_time:.2f}s | "
-            f"Tokens: {result.get('usage', {}).get('total_tokens', 0)} | "
-            f"Cost: ${cost:.4f}"
+            f"Tokens: {result.total_tokens} | "
+            f"Cost: ${cost:.4f} | "
+            f"Cache: {cache_status}"
         )
 
         return EmailRewriteResponse(
-            rewritten_email=result.get("content", ""),
+            rewritten_email=result.content,
             saved_to=None,
             metadata={
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": current_timestamp,
                 "processing_time": processing_time,
-                "tokens_used": result.get("usage", {}).get("total_tokens", 0),
+                "tokens_used": result.total_tokens,
                 "cost_usd": cost,
-                "model_used": result.get("model", "unknown"),
+                "model_used": result.model,
                 "correlation_id": request_id,
                 "target_audience": request.target_audience,
-                "tone": request.tone
+                "tone": request.tone,
+                "cache": cache_status
             }
         )
 
@@ -271,7 +540,87 @@ async def rewrite_email(
         )
 
 
-@app.post("/rewrite-upload")
+def sse_event(data: Dict, event: Optional[str] = None) -> bytes:
+    """Encode a server-sent event with a JSON payload."""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+@app.post("/rewrite/stream", dependencies=[Depends(enforce_rate_limit)])
+async def rewrite_email_stream(
+    request: EmailRewriteRequest,
+    email_service: EmailServiceInterface = Depends(get_email_service)
+):
+    """
+    Rewrite email content, streaming the result as server-sent events.
+
+    Accepts the same JSON body as /rewrite. Each chunk of the rewritten email
+    is sent as a ``data: {"delta": "..."}`` event as soon as OpenAI produces
+    it, followed by a final ``done`` event carrying the usage metadata, or an
+    ``error`` event if the rewrite fails part-way. Streamed responses are not
+    cached.
+
+    Args:
+        request: EmailRewriteRequest containing email text and parameters
+        email_service: Injected email service instance
+
+    Returns:
+        StreamingResponse of text/event-stream events
+    """
+    request_id = secrets.token_hex(16)
+    start_time = time.time()
+    completed: List[RewriteResult] = []
+
+    async def events():
+        logger.info(f"[{request_id}] → Streaming email rewrite...")
+        try:
+            async for delta in email_service.rewrite_email_stream(
+                email_text=request.email_text,
+                target_audience=request.target_audience,
+                tone=request.tone,
+                focus_areas=request.focus_areas,
+                additional_instructions=request.additional_instructions,
+                on_complete=completed.append
+            ):
+                yield sse_event({"delta": delta})
+        except Exception as e:
+            logger.error(f"[{request_id}] Streaming rewrite failed: {str(e)}")
+            code = (ErrorCode.OPENAI_ERROR if isinstance(e, OpenAIError)
+                    else ErrorCode.API_ERROR)
+            yield sse_event({
+                "error_code": code,
+                "message": f"Failed to process request: {str(e)}",
+                "correlation_id": request_id
+            }, event="error")
+            return
+
+        result = completed[0]
+        processing_time = time.time() - start_time
+        logger.info(
+            f"[{request_id}] ✓ Email rewrite streamed | "
+            f"Time: {processing_time:.2f}s | "
+            f"Tokens: {result.total_tokens} | "
+            f"Cost: ${result.cost_usd:.4f}"
+        )
+        yield sse_event({
+            "timestamp": current_timestamp,
+            "processing_time": processing_time,
+            "tokens_used": result.total_tokens,
+            "cost_usd": result.cost_usd,
+            "model_used": result.model,
+            "correlation_id": request_id,
+            "target_audience": request.target_audience,
+            "tone": request.tone
+        }, event="done")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Correlation-ID": request_id}
+    )
+
+
+@app.post("/rewrite-upload", dependencies=[Depends(enforce_rate_limit)])
 async def rewrite_email_upload(
     file: UploadFile = File(..., description="Email file (.txt, .pdf, .docx)"),
     target_audience: str = Form(..., description="Target audience or context"),
@@ -281,6 +630,8 @@ async def rewrite_email_upload(
         default=None, description="Comma-separated focus areas"),
     additional_instructions: Optional[str] = Form(
         default=None, description="Additional instructions"),
+    cache: bool = Query(
+        default=True, description="Set to false to bypass the response cache"),
     email_service: EmailServiceInterface = Depends(get_email_service)
 ):
     """
@@ -300,11 +651,12 @@ async def rewrite_email_upload(
         tone: Desired tone for the rewrite
         focus_areas: Comma-separated list of areas to emphasize
         additional_instructions: Optional specific instructions
+        cache: Whether the response cache may be used for this request
 
     Returns:
         JSON response with rewritten content and metadata
     """
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
     start_time = time.time()
 
     try:
@@ -326,19 +678,22 @@ async def rewrite_email_upload(
                 suggestion="Please upload .txt, .pdf, or .docx files only"
             )
 
-        # Read file content
-        file_content = await file.read()
-
-        # Validate file size
-        if not validate_file_size(file_content):
+        # Starlette has already spooled the upload (in memory up to 1MB, then
+        # on disk), so check the received size and extract from it in place
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+        if not validate_file_size(file_size):
             raise DetailedApiException(
                 error_code=ErrorCode.VALIDATION_ERROR,
                 message="File size exceeds maximum allowed size (10MB)",
                 suggestion="Please upload a smaller file"
             )
 
-        # Extract text from file
-        email_text = extract_text_from_file(file_content, file.filename)
+        # Extract text from file off the event loop
+        email_text = await asyncio.get_running_loop().run_in_executor(
+            EXTRACTION_POOL, extract_text_from_file, file.file, file.filename)
 
         if not email_text or len(email_text.strip()) < 10:
             raise DetailedApiException(
@@ -351,8 +706,10 @@ async def rewrite_email_upload(
         focus_areas_list = [area.strip() for area in focus_areas.split(
             ",")] if focus_areas else None
 
-        # Call the email service
-        result = await email_service.rewrite_email(
+        # Call the email service (or serve from cache)
+        result, cache_status = await rewrite_with_cache(
+            email_service,
+            cache,
             email_text=email_text,
             target_audience=target_audience,
             tone=tone,
@@ -361,27 +718,29 @@ async def rewrite_email_upload(
         )
 
         processing_time = time.time() - start_time
-        cost = result.get('usage', {}).get('cost_usd', 0)
+        cost = result.cost_usd
 
         logger.info(
             f"[{request_id}] ✓ File rewritten: {file.filename} | "
             f"Time: {processing_time:.2f}s | "
-            f"Tokens: {result.get('usage', {}).get('total_tokens', 0)} | "
-            f"Cost: ${cost:.4f}"
+            f"Tokens: {result.total_tokens} | "
+            f"Cost: ${cost:.4f} | "
+            f"Cache: {cache_status}"
         )
 
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "success",
-            "rewritten_email": result.get("content", ""),
+            "rewritten_email": result.content,
             "original_filename": file.filename,
             "target_audience": target_audience,
             "tone": tone,
             "processing_time": processing_time,
-            "model_used": result.get("model", "unknown"),
-            "tokens_used": result.get("usage", {}).get("total_tokens", 0),
-            "cost_usd": result.get("usage", {}).get("cost_usd", 0),
+            "model_used": result.model,
+            "tokens_used": result.total_tokens,
+            "cost_usd": cost,
             "correlation_id": request_id,
-            "timestamp": datetime.now().isoformat()
+            "cache": cache_status,
+            "timestamp": current_timestamp
         })
 
     except DetailedApiException:
@@ -415,10 +774,10 @@ async def get_folder_statistics():
     Useful for monitoring file processing activity.
     """
     try:
-        input_stats = get_folder_stats(INPUT_DIR)
-        output_stats = get_folder_stats(OUTPUT_DIR)
+        input_stats = get_cached_folder_stats(INPUT_DIR)
+        output_stats = get_cached_folder_stats(OUTPUT_DIR)
 
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "success",
             "input_folder": {
                 "path": str(INPUT_DIR),
@@ -428,7 +787,7 @@ async def get_folder_statistics():
                 "path": str(OUTPUT_DIR),
                 **output_stats
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": current_timestamp
         })
     except Exception as e:
         logger.error(f"Failed to get folder stats: {str(e)}")
@@ -439,6 +798,57 @@ async def get_folder_statistics():
         )
 
 
+@app.get("/cache/stats")
+async def get_cache_statistics():
+    """
+    Get response cache statistics.
+    Useful for monitoring how many OpenAI calls the cache avoids.
+    """
+    return ORJSONResponse(content={
+        "status": "success",
+        "exact_match": response_cache.stats(),
+        "semantic": {
+            "enabled": semantic_cache.enabled
+        },
+        "timestamp": current_timestamp
+    })
+
+
+def batch_input_files(
+    items: List[Tuple[Path, str]]
+) -> List[List[Tuple[Path, str]]]:
+    """
+    Group input files into batches for a single rewrite request each.
+
+    A batch holds at most INPUT_FOLDER_BATCH_SIZE emails whose estimated
+    token count (about 4 characters per token) stays within
+    INPUT_FOLDER_BATCH_TOKENS; larger files end up in batches of one.
+
+    Args:
+        items: (file path, email text) pairs in processing order
+
+    Returns:
+        List of batches preserving the input order
+    """
+    batches: List[List[Tuple[Path, str]]] = []
+    current: List[Tuple[Path, str]] = []
+    current_tokens = 0
+
+    for item in items:
+        tokens = len(item[1]) // 4
+        if current and (len(current) >= INPUT_FOLDER_BATCH_SIZE or
+                        current_tokens + tokens > INPUT_FOLDER_BATCH_TOKENS):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
 @app.post("/process-input-folder")
 async def process_input_folder_endpoint(
     target_audience: str = Form(...,
@@ -447,82 +857,126 @@ async def process_input_folder_endpoint(
 ):
     """
     Process all files in the input folder.
-    This endpoint scans the input folder for .txt files and processes them.
+    This endpoint scans the input folder for supported files (TXT, PDF, DOCX)
+    and processes them.
     """
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
     logger.set_request_context(request_id)
 
     try:
         # Scan for files
-        from utils.file_handler import scan_input_folder
         files = scan_input_folder(INPUT_DIR)
 
         if not files:
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "status": "success",
                 "message": "No files found in input folder",
                 "processed": 0,
                 "input_folder": str(INPUT_DIR)
             })
 
-        results = []
+        # Move processed files to subdirectory
+        processed_dir = INPUT_DIR / "processed"
+        processed_dir.mkdir(exist_ok=True)
 
-        for file_path in files:
+        # Bound concurrent OpenAI calls for this batch
+        semaphore = asyncio.Semaphore(INPUT_FOLDER_CONCURRENCY)
+        file_results: Dict[Path, dict] = {}
+
+        async def read_one(file_path: Path) -> Optional[str]:
+            """Extract an input file's text, recording skipped or failed files."""
             try:
-                # Read file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    email_text = f.read()
+                email_text = await asyncio.get_running_loop().run_in_executor(
+                    EXTRACTION_POOL, extract_text_from_file,
+                    file_path, file_path.name)
+            except Exception as e:
+                logger.error(f"Failed to process {file_path.name}: {str(e)}")
+                file_results[file_path] = {
+                    "file": file_path.name,
+                    "status": "error",
+                    "error": str(e)
+                }
+                return None
 
-                # Validate content length
-                if len(email_text) < 100:
-                    results.append({
-                        "file": file_path.name,
-                        "status": "skipped",
-                        "reason": "File too short (minimum 100 characters)"
-                    })
-                    continue
-
-                # Process with email service
-                result = await service.rewrite_email(
-                    email_text=email_text,
-                    target_audience=target_audience,
-                    tone="professional"
-                )
+            # Validate content length
+            if len(email_text) < 100:
+                file_results[file_path] = {
+                    "file": file_path.name,
+                    "status": "skipped",
+                    "reason": "File too short (minimum 100 characters)"
+                }
+                return None
+
+            return email_text
 
+        async def finish_one(file_path: Path, result: RewriteResult) -> dict:
+            """Save a rewritten email and move its input file to processed/."""
+            try:
                 # Save to output folder
-                from utils.file_handler import save_output_file
                 output_path = await save_output_file(
-                    result.get("content", ""),
+                    result.content,
                     OUTPUT_DIR,
                     f"processed_{file_path.stem}"
                 )
 
-                # Move processed file to subdirectory
-                processed_dir = INPUT_DIR / "processed"
-                processed_dir.mkdir(exist_ok=True)
                 moved_path = processed_dir / file_path.name
-                file_path.rename(moved_path)
+                await asyncio.to_thread(file_path.rename, moved_path)
 
-                results.append({
+                return {
                     "file": file_path.name,
                     "status": "success",
                     "output": str(output_path),
                     "moved_to": str(moved_path)
-                })
+                }
 
             except Exception as e:
                 logger.error(f"Failed to process {file_path.name}: {str(e)}")
-                results.append({
+                return {
                     "file": file_path.name,
                     "status": "error",
                     "error": str(e)
-                })
+                }
 
-        return JSONResponse(content={
+        async def process_batch(batch: List[Tuple[Path, str]]) -> None:
+            """Rewrite a batch of files with one email service call."""
+            try:
+                async with semaphore:
+                    batch_results = await service.rewrite_email_batch(
+                        email_texts=[email_text for _, email_text in batch],
+                        target_audience=target_audience,
+                        tone="professional"
+                    )
+            except Exception as e:
+                for file_path, _ in batch:
+                    logger.error(
+                        f"Failed to process {file_path.name}: {str(e)}")
+                    file_results[file_path] = {
+                        "file": file_path.name,
+                        "status": "error",
+                        "error": str(e)
+                    }
+                return
+
+            for (file_path, _), result in zip(batch, batch_results):
+                file_results[file_path] = await finish_one(file_path, result)
+
+        # Read files concurrently, then rewrite small files in shared batches
+        email_texts = await asyncio.gather(
+            *(read_one(file_path) for file_path in files))
+        pending = [(file_path, email_text)
+                   for file_path, email_text in zip(files, email_texts)
+                   if email_text is not None]
+        await asyncio.gather(
+            *(process_batch(batch) for batch in batch_input_files(pending)))
+
+        results = [file_results[file_path] for file_path in files]
+        counts = Counter(r["status"] for r in results)
+
+        return ORJSONResponse(content={
             "status": "success",
-            "processed": len([r for r in results if r["status"] == "success"]),
-            "failed": len([r for r in results if r["status"] == "error"]),
-            "skipped": len([r for r in results if r["status"] == "skipped"]),
+            "processed": counts["success"],
+            "failed": counts["error"],
+            "skipped": counts["skipped"],
             "results": results,
             "request_id": request_id
         })
@@ -541,7 +995,7 @@ async def get_supported_formats():
     """
     Get list of supported file formats and their details.
     """
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "supported_formats": [
             {
                 "extension": ".txt",
@@ -554,7 +1008,7 @@ async def get_supported_formats():
                 "mime_type": "application/pdf",
                 "description": "PDF documents",
                 "max_size_mb": 10,
-                "requires": "PyPDF2"
+                "requires": "pypdfium2 or PyPDF2"
             },
             {
                 "extension": ".docx",
@@ -1,8 +1,10 @@
 from pydantic import BaseModel, Field, field_validator
 from .shared import ToneEnum
 from typing import Optional
-import re
-import uuid
+import secrets
+
+# Translation table that deletes ASCII control characters (0x00-0x1F, 0x7F)
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), 0x7F])
 
 
 class EmailRewriteRequest(BaseModel):
@@ -44,7 +46,7 @@ class EmailRewriteRequest(BaseModel):
     )
 
     correlation_id: Optional[str] = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=lambda: secrets.token_hex(16),
         description="Correlation ID for request tracking"
     )
 
@@ -53,7 +55,7 @@ class EmailRewriteRequest(BaseModel):
     def validate_email_text(cls, v: str) -> str:
         """Validate email text has meaningful content"""
         # Remove control characters
-        v = re.sub(r'[\x00-\x1F\x7F]', '', v).strip()
+        v = v.translate(_CONTROL_CHARS).strip()
 
         # Check for minimum word count
         word_count = len(v.split())
@@ -68,7 +70,7 @@ class EmailRewriteRequest(BaseModel):
     def validate_target_audience(cls, v: str) -> str:
         """Validate target audience has meaningful content"""
         # Remove control characters
-        v = re.sub(r'[\x00-\x1F\x7F]', '', v).strip()
+        v = v.translate(_CONTROL_CHARS).strip()
 
         # Check for minimum word count
         word_count = len(v.split())
@@ -1,6 +1,5 @@
 from pydantic import BaseModel, Field
 from typing import Optional
-from datetime import datetime, timezone
 from .shared import StatusEnum
 
 
@@ -19,11 +18,7 @@ class EmailRewriteResponse(BaseModel):
         description="Path where the result was saved"
     )
     metadata: dict = Field(
-        default_factory=lambda: {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "processing_time": None,
-            "tokens_used": None
-        },
+        default_factory=dict,
         description="Metadata about the request"
     )
 
@@ -34,9 +29,4 @@ class HealthResponse(BaseModel):
     version: str
     uptime: float
     message: Optional[str] = None
-    dependencies: dict = Field(
-        default_factory=lambda: {
-            "openai": "healthy",
-            "file_system": "ok"
-        }
-    )
+    dependencies: dict = Field(default_factory=dict)
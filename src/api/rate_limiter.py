@@ -0,0 +1,52 @@
+# api/rate_limiter.py
+import math
+import time
+
+from cachetools import TTLCache
+
+from .exceptions import APIRateLimitError
+
+
+class TokenBucket:
+    """Token bucket refilled lazily when a request arrives"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def take(self) -> None:
+        """Take one token or raise APIRateLimitError without waiting"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            raise APIRateLimitError(retry_after=math.ceil(wait))
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """Per-client token bucket rate limiter"""
+
+    def __init__(self, requests: int, period: int,
+                 max_clients: int = 10_000):
+        self.rate = requests / period
+        self.capacity = requests
+        # Idle buckets refill completely within one period, so drop them
+        self._buckets: TTLCache = TTLCache(maxsize=max_clients, ttl=period)
+
+    def bucket(self, key: str) -> TokenBucket:
+        """Get the bucket for key, refreshing its idle expiry"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.capacity)
+        self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, key: str) -> None:
+        """Take one request token for key or raise APIRateLimitError"""
+        self.bucket(key).take()
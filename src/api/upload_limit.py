@@ -0,0 +1,39 @@
+# api/upload_limit.py
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .models import ErrorCode
+from .responses import ORJSONResponse
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject uploads whose declared Content-Length exceeds the limit.
+
+    A plain ASGI middleware: it runs before the body is received, so
+    oversized files are never spooled, and every other request passes
+    straight through. Requests without a Content-Length (chunked) are
+    still checked against the received size in the upload endpoint.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (scope["type"] == "http" and scope["method"] == "POST"
+                and scope["path"] == self.path):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = ORJSONResponse(status_code=413, content={
+                            "detail": {
+                                "error_code": ErrorCode.VALIDATION_ERROR.value,
+                                "message": "File size exceeds maximum allowed size (10MB)",
+                                "suggestion": "Please upload a smaller file"
+                            }
+                        })
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
@@ -8,6 +8,10 @@ Last Updated: November 2025
 Source: https://openai.com/api/pricing/
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 # Pricing in USD per 1,000 tokens
 PRICING_CONFIG = {
     'gpt-4o': {
@@ -37,8 +41,19 @@ PRICING_CONFIG = {
     }
 }
 
+# Read-only input/output rates per model, shared by every pricing lookup
+_PRICING = {
+    key: MappingProxyType({'input': config['input'], 'output': config['output']})
+    for key, config in PRICING_CONFIG.items()
+}
+
+# Model keys, longest first, so versioned names match their most specific
+# family (gpt-4o-mini-2024-07-18 -> gpt-4o-mini, not gpt-4o or gpt-4)
+_PREFIXES = tuple(sorted(PRICING_CONFIG, key=len, reverse=True))
 
-def get_model_pricing(model_name: str) -> dict:
+
+@lru_cache(maxsize=32)
+def get_model_pricing(model_name: str) -> Mapping[str, float]:
     """
     Get pricing for a specific model.
 
@@ -46,32 +61,23 @@ def get_model_pricing(model_name: str) -> dict:
         model_name: Name of the OpenAI model
 
     Returns:
-        Dict with 'input' and 'output' pricing per 1K tokens
+        Read-only mapping with 'input' and 'output' pricing per 1K tokens
         Falls back to GPT-4o pricing if model not found
     """
     # Handle model name variations
     model_key = model_name.lower().strip()
 
     # Direct match
-    if model_key in PRICING_CONFIG:
-        return {
-            'input': PRICING_CONFIG[model_key]['input'],
-            'output': PRICING_CONFIG[model_key]['output']
-        }
+    if model_key in _PRICING:
+        return _PRICING[model_key]
 
     # Partial match for versioned models (e.g., gpt-4-0613)
-    for key in PRICING_CONFIG.keys():
+    for key in _PREFIXES:
         if model_key.startswith(key):
-            return {
-                'input': PRICING_CONFIG[key]['input'],
-                'output': PRICING_CONFIG[key]['output']
-            }
+            return _PRICING[key]
 
     # Default fallback to GPT-4o (most common/cost-effective)
-    return {
-        'input': PRICING_CONFIG['gpt-4o']['input'],
-        'output': PRICING_CONFIG['gpt-4o']['output']
-    }
+    return _PRICING['gpt-4o']
 
 
 def get_all_models() -> dict:
@@ -102,6 +108,7 @@ def calculate_cost(input_tokens: int, output_tokens: int, model_name: str) -> fl
     return round(input_cost + output_cost, 6)
 
 
+@lru_cache(maxsize=32)
 def get_model_description(model_name: str) -> str:
     """
     Get description for a specific model.
@@ -114,8 +121,8 @@ def get_model_description(model_name: str) -> str:
     """
     model_key = model_name.lower().strip()
 
-    for key, config in PRICING_CONFIG.items():
+    for key in _PREFIXES:
         if model_key.startswith(key):
-            return config.get('description', 'OpenAI model')
+            return PRICING_CONFIG[key].get('description', 'OpenAI model')
 
     return 'OpenAI model'
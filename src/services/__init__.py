@@ -1,3 +1,7 @@
+from .base import RewriteResult
 from .email_service import EmailService, EmailServiceInterface
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
 
-__all__ = ["EmailService", "EmailServiceInterface"]
+__all__ = ["EmailService", "EmailServiceInterface", "RewriteResult",
+           "ResponseCache", "SemanticCache"]
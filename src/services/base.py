@@ -1,8 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Callable, NamedTuple, Optional, List
+
+
+class RewriteResult(NamedTuple):
+    """Rewritten email with its token usage and cost"""
+    content: str
+    total_tokens: int
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+    model: str
 
 
 class EmailServiceInterface(ABC):
+    # No instance state, so slotted subclasses stay free of __dict__
+    __slots__ = ()
+
     @abstractmethod
     async def rewrite_email(
         self,
@@ -11,6 +24,43 @@ class EmailServiceInterface(ABC):
         tone: str = "professional",
         focus_areas: Optional[List[str]] = None,
         additional_instructions: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> RewriteResult:
         """Abstract method for email rewriting"""
         pass
+
+    async def rewrite_email_batch(
+        self,
+        email_texts: List[str],
+        target_audience: str,
+        tone: str = "professional"
+    ) -> List[RewriteResult]:
+        """Rewrite several emails sharing an audience and tone (one call each by default)"""
+        return [
+            await self.rewrite_email(
+                email_text=email_text,
+                target_audience=target_audience,
+                tone=tone
+            )
+            for email_text in email_texts
+        ]
+
+    async def rewrite_email_stream(
+        self,
+        email_text: str,
+        target_audience: str,
+        tone: str = "professional",
+        focus_areas: Optional[List[str]] = None,
+        additional_instructions: Optional[str] = None,
+        on_complete: Optional[Callable[[RewriteResult], None]] = None
+    ) -> AsyncIterator[str]:
+        """Stream a rewritten email (a single chunk by default), then report the result to on_complete"""
+        result = await self.rewrite_email(
+            email_text=email_text,
+            target_audience=target_audience,
+            tone=tone,
+            focus_areas=focus_areas,
+            additional_instructions=additional_instructions
+        )
+        if on_complete is not None:
+            on_complete(result)
+        yield result.content
@@ -5,11 +5,14 @@ This module provides the email rewriting service that uses OpenAI GPT models
 with structured Jinja2 prompt templates for better prompt engineering.
 """
 
-from .base import EmailServiceInterface
-from typing import Optional, Dict, Any, List
+from .base import EmailServiceInterface, RewriteResult
+from typing import AsyncIterator, Callable, Optional, List
+import asyncio
 import os
+import orjson
 from openai import AsyncOpenAI
-from utils.prompt_templates import prompt_templates
+from .openai_client import get_async_client
+from utils.prompt_templates import get_prompt_templates
 from config.pricing import get_model_pricing
 
 
@@ -24,6 +27,9 @@ class EmailService(EmailServiceInterface):
     - Async API calls for better performance
     """
 
+    __slots__ = ('_client', 'model', 'max_tokens', 'temperature', 'pricing',
+                 '_input_rate', '_output_rate')
+
     def __init__(self, client: Optional[AsyncOpenAI] = None):
         """
         Initialize service with optional OpenAI client.
@@ -36,20 +42,78 @@ class EmailService(EmailServiceInterface):
         self.model = os.getenv('MODEL_NAME', 'gpt-4o-mini')
         self.max_tokens = int(os.getenv('MAX_TOKENS', '2000'))
         self.temperature = float(os.getenv('TEMPERATURE', '0.7'))
-        # Get dynamic pricing for the model
+        # Get dynamic pricing for the model, converted to per-token rates
         self.pricing = get_model_pricing(self.model)
+        self._input_rate = self.pricing['input'] / 1000
+        self._output_rate = self.pricing['output'] / 1000
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazy initialization of OpenAI client."""
+        """Lazy initialization of the shared OpenAI client."""
         if self._client is None:
             api_key = os.getenv('OPENAI_API_KEY')
             if not api_key:
                 raise ValueError(
                     "OPENAI_API_KEY not found in environment variables")
-            self._client = AsyncOpenAI(api_key=api_key)
+            self._client = get_async_client(api_key)
         return self._client
 
+    @staticmethod
+    def _build_system_prompt() -> str:
+        """Get the system prompt; it does not vary per request."""
+        return get_prompt_templates().get_base_system_prompt()
+
+    def _calculate_cost(self, usage_data) -> float:
+        """Calculate the USD cost of a completion's token usage."""
+        return (usage_data.prompt_tokens * self._input_rate +
+                usage_data.completion_tokens * self._output_rate)
+
+    def _format_result(self, response) -> RewriteResult:
+        """
+        Convert a chat completion into a RewriteResult.
+
+        Raises:
+            ValueError: If the response has no content or usage data
+        """
+        rewritten_content = response.choices[0].message.content
+        if not rewritten_content:
+            raise ValueError("OpenAI returned empty response")
+        usage_data = response.usage
+        if not usage_data:
+            raise ValueError("OpenAI returned no usage data")
+
+        return RewriteResult(
+            content=rewritten_content.strip(),
+            total_tokens=usage_data.total_tokens,
+            input_tokens=usage_data.prompt_tokens,
+            output_tokens=usage_data.completion_tokens,
+            cost_usd=round(self._calculate_cost(usage_data), 4),
+            model=self.model
+        )
+
+    def _rewrite_messages(
+        self,
+        email_text: str,
+        target_audience: str,
+        tone: str,
+        focus_areas: Optional[List[str]],
+        additional_instructions: Optional[str]
+    ) -> List[dict]:
+        """Build the chat messages for an email rewrite request."""
+        # Generate structured prompt using Jinja2 templates
+        user_prompt = get_prompt_templates().get_email_rewrite_prompt(
+            email_text=email_text,
+            target_audience=target_audience,
+            tone=tone,
+            additional_instructions=additional_instructions,
+            focus_areas=focus_areas
+        )
+
+        return [
+            {"role": "system", "content": self._build_system_prompt()},
+            {"role": "user", "content": user_prompt}
+        ]
+
     async def rewrite_email(
         self,
         email_text: str,
@@ -57,7 +121,7 @@ class EmailService(EmailServiceInterface):
         tone: str = "professional",
         focus_areas: Optional[List[str]] = None,
         additional_instructions: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> RewriteResult:
         """
         Rewrite email using OpenAI with Jinja2-structured prompts.
 
@@ -69,57 +133,84 @@ class EmailService(EmailServiceInterface):
             additional_instructions: Optional specific instructions
 
         Returns:
-            Dict containing:
-                - content: Rewritten email text
-                - usage: Token usage statistics
-                - model: Model used
+            RewriteResult with the rewritten email, token usage, cost and model
         """
-        # Generate structured prompt using Jinja2 templates
-        system_prompt = prompt_templates.get_base_system_prompt()
-        user_prompt = prompt_templates.get_email_rewrite_prompt(
-            email_text=email_text,
-            target_audience=target_audience,
-            tone=tone,
-            focus_areas=focus_areas,
-            additional_instructions=additional_instructions
-        )
-
         # Call OpenAI API
         response = await self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=self._rewrite_messages(
+                email_text, target_audience, tone,
+                focus_areas, additional_instructions),
             temperature=self.temperature,
             max_tokens=self.max_tokens
         )
 
-        # Extract response and usage data
-        rewritten_content = response.choices[0].message.content
-        if not rewritten_content:
+        return self._format_result(response)
+
+    async def rewrite_email_stream(
+        self,
+        email_text: str,
+        target_audience: str,
+        tone: str = "professional",
+        focus_areas: Optional[List[str]] = None,
+        additional_instructions: Optional[str] = None,
+        on_complete: Optional[Callable[[RewriteResult], None]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Rewrite email, yielding the rewritten text as OpenAI generates it.
+
+        Args:
+            email_text: Original email content
+            target_audience: Description of target audience or context
+            tone: Desired tone (professional, casual, academic)
+            focus_areas: Optional list of areas to emphasize
+            additional_instructions: Optional specific instructions
+            on_complete: Optional callback receiving the final RewriteResult
+                once the stream has finished
+
+        Yields:
+            str: Chunks of the rewritten email
+
+        Raises:
+            ValueError: If OpenAI streams no content or no usage data
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=self._rewrite_messages(
+                email_text, target_audience, tone,
+                focus_areas, additional_instructions),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        parts: List[str] = []
+        usage_data = None
+        async for chunk in stream:
+            # Usage arrives in a final chunk with no choices
+            if chunk.usage is not None:
+                usage_data = chunk.usage
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        if not parts:
             raise ValueError("OpenAI returned empty response")
-        rewritten_content = rewritten_content.strip()
-        usage_data = response.usage
         if not usage_data:
             raise ValueError("OpenAI returned no usage data")
 
-        # Calculate cost using dynamic pricing from config
-        input_cost = (usage_data.prompt_tokens / 1000) * self.pricing['input']
-        output_cost = (usage_data.completion_tokens / 1000) * \
-            self.pricing['output']
-        total_cost = input_cost + output_cost
-
-        return {
-            "content": rewritten_content,
-            "usage": {
-                "total_tokens": usage_data.total_tokens,
-                "input_tokens": usage_data.prompt_tokens,
-                "output_tokens": usage_data.completion_tokens,
-                "cost_usd": round(total_cost, 4)
-            },
-            "model": self.model
-        }
+        if on_complete is not None:
+            on_complete(RewriteResult(
+                content="".join(parts).strip(),
+                total_tokens=usage_data.total_tokens,
+                input_tokens=usage_data.prompt_tokens,
+                output_tokens=usage_data.completion_tokens,
+                cost_usd=round(self._calculate_cost(usage_data), 4),
+                model=self.model
+            ))
 
     async def rewrite_job_application_email(
         self,
@@ -127,7 +218,7 @@ class EmailService(EmailServiceInterface):
         job_description: str,
         company_name: Optional[str] = None,
         key_qualifications: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
+    ) -> RewriteResult:
         """
         Specialized method for job application emails.
 
@@ -138,10 +229,10 @@ class EmailService(EmailServiceInterface):
             key_qualifications: Key qualifications to highlight
 
         Returns:
-            Dict with rewritten content and usage statistics
+            RewriteResult with rewritten content and usage statistics
         """
-        system_prompt = prompt_templates.get_base_system_prompt()
-        user_prompt = prompt_templates.get_job_application_email_prompt(
+        system_prompt = self._build_system_prompt()
+        user_prompt = get_prompt_templates().get_job_application_email_prompt(
             email_text=email_text,
             job_description=job_description,
             company_name=company_name,
@@ -158,26 +249,107 @@ class EmailService(EmailServiceInterface):
             max_tokens=self.max_tokens
         )
 
-        rewritten_content = response.choices[0].message.content
-        if not rewritten_content:
+        return self._format_result(response)
+
+    async def rewrite_email_batch(
+        self,
+        email_texts: List[str],
+        target_audience: str,
+        tone: str = "professional"
+    ) -> List[RewriteResult]:
+        """
+        Rewrite several emails sharing an audience and tone in one OpenAI call.
+
+        The model is asked for a JSON object with one rewrite per email. If the
+        response cannot be parsed or is incomplete, each email is rewritten
+        individually instead.
+
+        Args:
+            email_texts: Original email contents
+            target_audience: Common target audience or context
+            tone: Desired tone (professional, casual, academic)
+
+        Returns:
+            List of RewriteResults in input order.
+            Batched results split the request's token usage and cost evenly.
+        """
+        if len(email_texts) == 1:
+            return [await self.rewrite_email(
+                email_text=email_texts[0],
+                target_audience=target_audience,
+                tone=tone
+            )]
+
+        try:
+            return await self._rewrite_batch_request(
+                email_texts, target_audience, tone)
+        except ValueError:
+            return list(await asyncio.gather(*(
+                self.rewrite_email(
+                    email_text=email_text,
+                    target_audience=target_audience,
+                    tone=tone
+                )
+                for email_text in email_texts
+            )))
+
+    async def _rewrite_batch_request(
+        self,
+        email_texts: List[str],
+        target_audience: str,
+        tone: str
+    ) -> List[RewriteResult]:
+        """Issue the batched JSON-mode request and parse its rewrites."""
+        system_prompt = self._build_system_prompt()
+        user_prompt = get_prompt_templates().get_batch_rewrite_json_prompt(
+            email_texts=email_texts,
+            target_audience=target_audience,
+            tone=tone
+        )
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=self.temperature,
+            # Each email gets the single-rewrite output budget
+            max_tokens=self.max_tokens * len(email_texts),
+            response_format={"type": "json_object"}
+        )
+
+        if response.choices[0].finish_reason == "length":
+            raise ValueError("Batch response was truncated at max_tokens")
+        raw_content = response.choices[0].message.content
+        if not raw_content:
             raise ValueError("OpenAI returned empty response")
-        rewritten_content = rewritten_content.strip()
         usage_data = response.usage
         if not usage_data:
             raise ValueError("OpenAI returned no usage data")
 
-        # Calculate cost using dynamic pricing from config
-        input_cost = (usage_data.prompt_tokens / 1000) * self.pricing['input']
-        output_cost = (usage_data.completion_tokens / 1000) * \
-            self.pricing['output']
-
-        return {
-            "content": rewritten_content,
-            "usage": {
-                "total_tokens": usage_data.total_tokens,
-                "input_tokens": usage_data.prompt_tokens,
-                "output_tokens": usage_data.completion_tokens,
-                "cost_usd": round(input_cost + output_cost, 4)
-            },
-            "model": self.model
-        }
+        try:
+            entries = orjson.loads(raw_content)["emails"]
+            rewrites = {int(entry["id"]): str(entry["rewritten"]).strip()
+                        for entry in entries}
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed batch response: {str(e)}")
+
+        contents = [rewrites.get(i) for i in range(1, len(email_texts) + 1)]
+        if not all(contents):
+            raise ValueError("Batch response is missing rewritten emails")
+
+        count = len(email_texts)
+        cost = self._calculate_cost(usage_data)
+
+        return [
+            RewriteResult(
+                content=content,
+                total_tokens=usage_data.total_tokens // count,
+                input_tokens=usage_data.prompt_tokens // count,
+                output_tokens=usage_data.completion_tokens // count,
+                cost_usd=round(cost / count, 4),
+                model=self.model
+            )
+            for content in contents
+        ]
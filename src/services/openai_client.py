@@ -0,0 +1,48 @@
+"""
+Shared OpenAI Client
+
+Services that talk to OpenAI share one AsyncOpenAI client per API key, so
+every request reuses the same keep-alive connection pool instead of paying
+a fresh TCP and TLS handshake.
+"""
+
+import threading
+from typing import Dict
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# Connection pool limits for the shared HTTP client
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+_clients: Dict[str, AsyncOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_async_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client for an API key, creating it once.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        AsyncOpenAI: Client backed by a pooled keep-alive HTTP client
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=DefaultAsyncHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                        )
+                    )
+                )
+                _clients[api_key] = client
+    return client
@@ -0,0 +1,94 @@
+"""
+Exact-Match Response Cache
+
+First cache tier for email rewrite results. Requests are keyed by a SHA-256
+of their whitespace- and case-normalized inputs, so idempotent retries and
+repeated submissions skip the OpenAI round trip (and the embedding call of
+the semantic tier) entirely.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+from typing import Any, Dict, Optional, Sequence
+
+from cachetools import TTLCache
+
+from .base import RewriteResult
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class ResponseCache:
+    """
+    In-process TTL cache of rewrite results with hit/miss accounting.
+    """
+
+    def __init__(self):
+        """Initialize cache settings from the environment."""
+        self._cache: TTLCache = TTLCache(
+            maxsize=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '10000')),
+            ttl=int(os.getenv('RESPONSE_CACHE_TTL', '3600'))
+        )
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        email_text: str,
+        target_audience: str,
+        tone: str,
+        focus_areas: Optional[Sequence[str]],
+        additional_instructions: Optional[str],
+        model: str
+    ) -> str:
+        """
+        Build the cache key for a rewrite request.
+
+        Returns:
+            str: SHA-256 hex digest of the normalized request fields
+        """
+        normalized = _WHITESPACE.sub(' ', email_text).strip().lower()
+        raw = "\x1f".join([
+            normalized,
+            target_audience,
+            tone,
+            "\x1e".join(focus_areas or ()),
+            additional_instructions or "",
+            model
+        ])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[RewriteResult]:
+        """Return the cached result for key, or None on a miss."""
+        async with self._lock:
+            result = self._cache.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    async def set(self, key: str, result: RewriteResult) -> None:
+        """Store a rewrite result under key."""
+        async with self._lock:
+            self._cache[key] = result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry count, hits, misses and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._cache.maxsize,
+            "ttl_seconds": self._cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,177 @@
+"""
+Semantic Response Cache
+
+Caches rewrite results keyed by an embedding of the email text so that
+near-duplicate requests can be answered without another chat completion.
+Entries are namespaced by the non-text request fields (audience, tone,
+focus areas, instructions, model), which must match exactly for a hit.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from cachetools import TTLCache
+from openai import AsyncOpenAI
+
+from .base import RewriteResult
+from .openai_client import get_async_client
+
+
+class SemanticCache:
+    """
+    In-process semantic cache for email rewrite results.
+
+    Vectors are L2-normalized on insert, so cosine distance reduces to
+    ``1 - dot(a, b)``. Each namespace holds a bounded list of entries that
+    expire after a configurable TTL, and the number of namespaces is
+    bounded as well.
+    """
+
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
+        """
+        Initialize cache settings from the environment.
+
+        Args:
+            client: Optional AsyncOpenAI client used to compute embeddings
+        """
+        self._client = client
+        self.enabled = os.getenv(
+            'SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true'
+        self.embedding_model = os.getenv(
+            'SEMANTIC_CACHE_MODEL', 'text-embedding-3-small')
+        self.dimensions = int(os.getenv('SEMANTIC_CACHE_DIMENSIONS', '256'))
+        self.max_distance = float(
+            os.getenv('SEMANTIC_CACHE_MAX_DISTANCE', '0.05'))
+        self.ttl = int(os.getenv('SEMANTIC_CACHE_TTL', '3600'))
+        self.max_entries = int(
+            os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', '256'))
+        # Namespaces come from free-text request fields, so bound them too;
+        # a namespace idles out one TTL after its last store
+        self._entries: TTLCache = TTLCache(
+            maxsize=int(os.getenv('SEMANTIC_CACHE_MAX_NAMESPACES', '1024')),
+            ttl=self.ttl
+        )
+        self._lock = asyncio.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Lazy initialization of the shared OpenAI client."""
+        if self._client is None:
+            api_key = os.getenv('OPENAI_API_KEY')
+            if not api_key:
+                raise ValueError(
+                    "OPENAI_API_KEY not found in environment variables")
+            self._client = get_async_client(api_key)
+        return self._client
+
+    @staticmethod
+    def namespace(
+        target_audience: str,
+        tone: str,
+        focus_areas: Optional[Sequence[str]],
+        additional_instructions: Optional[str],
+        model: str
+    ) -> str:
+        """
+        Build the namespace key from the fields that must match exactly.
+
+        Returns:
+            str: SHA-256 hex digest of the non-text request fields
+        """
+        raw = "\x1f".join([
+            target_audience,
+            tone,
+            "\x1e".join(focus_areas or ()),
+            additional_instructions or "",
+            model
+        ])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text and return an L2-normalized vector."""
+        response = await self.client.embeddings.create(
+            model=self.embedding_model,
+            input=text,
+            dimensions=self.dimensions
+        )
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    async def lookup(
+        self,
+        namespace: str,
+        email_text: str
+    ) -> Tuple[Optional[RewriteResult], Optional[List[float]]]:
+        """
+        Find a cached result for a near-duplicate email in the namespace.
+
+        Args:
+            namespace: Key returned by ``namespace()``
+            email_text: Email content to embed and compare
+
+        Returns:
+            Tuple of (cached result or None, embedding for a later ``store``).
+            Both are None when the cache is disabled or embedding fails.
+        """
+        if not self.enabled:
+            return None, None
+
+        try:
+            embedding = await self._embed(email_text)
+        except Exception as e:
+            self.logger.warning(f"Semantic cache embedding failed: {str(e)}")
+            return None, None
+
+        now = time.monotonic()
+        best_result = None
+        best_distance = self.max_distance
+
+        async with self._lock:
+            entries = self._entries.get(namespace)
+            if entries:
+                # Prune in place so a lookup does not extend the namespace
+                entries[:] = [entry for entry in entries if entry[0] > now]
+                if not entries:
+                    self._entries.pop(namespace, None)
+
+            for _, vector, result in entries or ():
+                distance = 1.0 - sum(a * b for a, b in zip(embedding, vector))
+                if distance < best_distance:
+                    best_distance = distance
+                    best_result = result
+
+        return best_result, embedding
+
+    async def store(
+        self,
+        namespace: str,
+        embedding: Optional[List[float]],
+        result: RewriteResult
+    ) -> None:
+        """
+        Store a rewrite result under its embedding.
+
+        Args:
+            namespace: Key returned by ``namespace()``
+            embedding: Vector returned by ``lookup()``; no-op when None
+            result: Email service result to cache
+        """
+        if not self.enabled or embedding is None:
+            return
+
+        now = time.monotonic()
+        async with self._lock:
+            entries = [entry for entry in self._entries.get(namespace, ())
+                       if entry[0] > now]
+            entries.append((now + self.ttl, embedding, result))
+            if len(entries) > self.max_entries:
+                del entries[0]
+            # Reassign to refresh the namespace's expiry and LRU position
+            self._entries[namespace] = entries
@@ -1,16 +1,26 @@
-import aiofiles
+import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import BinaryIO, List, Optional, Union
 from io import BytesIO
 import logging
 import mimetypes
+import os
 
 # Import libraries with proper error handling
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 try:
     import PyPDF2
-    PDF_AVAILABLE = True
+    PYPDF2_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    PYPDF2_AVAILABLE = False
+
+PDF_AVAILABLE = PDFIUM_AVAILABLE or PYPDF2_AVAILABLE
 
 try:
     import docx
@@ -18,35 +28,86 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+try:
+    from charset_normalizer import from_bytes
+    CHARSET_DETECTION_AVAILABLE = True
+except ImportError:
+    CHARSET_DETECTION_AVAILABLE = False
 
-def extract_text_from_pdf(file: BinaryIO) -> str:
-    """Extract text from PDF file."""
-    if not PDF_AVAILABLE:
-        raise ValueError(
-            "PDF processing not available. Install PyPDF2: pip install PyPDF2")
 
-    try:
-        # Read the file content into BytesIO for compatibility
-        content = file.read()
-        if len(content) == 0:
-            raise ValueError("PDF file is empty")
+def _file_extension(filename: str) -> str:
+    """Get the lowercase extension of filename including the dot."""
+    name, dot, ext = filename.rpartition('.')
+    return dot + ext.lower() if name.rstrip('.') else ''
 
-        file_like = BytesIO(content)
-        pdf_reader = PyPDF2.PdfReader(file_like)
 
-        if len(pdf_reader.pages) == 0:
+def _stream_size(file: BinaryIO) -> int:
+    """Get the size of a seekable stream and rewind it."""
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+
+def _extract_pdf_pages_pdfium(file: BinaryIO) -> List[str]:
+    """Extract the text of each PDF page using native PDFium."""
+    pdf = pdfium.PdfDocument(file)
+    try:
+        if len(pdf) == 0:
             raise ValueError("PDF file has no pages")
 
-        text = ""
-        for page_num, page in enumerate(pdf_reader.pages):
+        page_texts = []
+        for page_num in range(len(pdf)):
             try:
-                page_text = page.extract_text()
-                if page_text.strip():
-                    text += page_text + "\n"
+                textpage = pdf[page_num].get_textpage()
+                page_texts.append(
+                    textpage.get_text_range().replace("\r\n", "\n"))
             except Exception as e:
                 logging.warning(
                     f"Failed to extract text from PDF page {page_num}: {e}")
-                continue
+        return page_texts
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_pages_pypdf2(file: BinaryIO) -> List[str]:
+    """Extract the text of each PDF page using pure-Python PyPDF2."""
+    pdf_reader = PyPDF2.PdfReader(file)
+
+    if len(pdf_reader.pages) == 0:
+        raise ValueError("PDF file has no pages")
+
+    page_texts = []
+    for page_num, page in enumerate(pdf_reader.pages):
+        try:
+            page_texts.append(page.extract_text())
+        except Exception as e:
+            logging.warning(
+                f"Failed to extract text from PDF page {page_num}: {e}")
+    return page_texts
+
+
+def extract_text_from_pdf(file: BinaryIO) -> str:
+    """Extract text from PDF file, preferring pypdfium2 over PyPDF2."""
+    if not PDF_AVAILABLE:
+        raise ValueError(
+            "PDF processing not available. Install pypdfium2: pip install pypdfium2")
+
+    try:
+        if _stream_size(file) == 0:
+            raise ValueError("PDF file is empty")
+
+        if PDFIUM_AVAILABLE:
+            # PDFium reads through readinto(), which SpooledTemporaryFile
+            # lacks before Python 3.11
+            if not hasattr(file, 'readinto'):
+                file = BytesIO(file.read())
+            page_texts = _extract_pdf_pages_pdfium(file)
+        else:
+            page_texts = _extract_pdf_pages_pypdf2(file)
+
+        text = "".join(page_text + "\n" for page_text in page_texts
+                       if page_text.strip())
 
         if not text.strip():
             raise ValueError("No text could be extracted from the PDF")
@@ -63,28 +124,39 @@ def extract_text_from_docx(file: BinaryIO) -> str:
             "DOCX processing not available. Install python-docx: pip install python-docx")
 
     try:
-        # Read the file content into BytesIO for compatibility
-        content = file.read()
-        if len(content) == 0:
+        if _stream_size(file) == 0:
             raise ValueError("DOCX file is empty")
 
-        file_like = BytesIO(content)
-        doc = docx.Document(file_like)
+        doc = docx.Document(file)
 
-        text_parts = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text.strip())
+        # Strip each paragraph once and drop the empty ones
+        text_parts = [text for text in
+                      (paragraph.text.strip() for paragraph in doc.paragraphs)
+                      if text]
 
         if not text_parts:
             raise ValueError("No text content found in DOCX file")
 
-        text = "\n".join(text_parts)
-        return text.strip()
+        return "\n".join(text_parts)
     except Exception as e:
         raise ValueError(f"Failed to process DOCX file: {str(e)}")
 
 
+def _decode_text(content: bytes) -> str:
+    """Decode text as UTF-8, detecting the encoding in one pass otherwise."""
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+
+    if CHARSET_DETECTION_AVAILABLE:
+        best = from_bytes(content).best()
+        if best is not None:
+            return str(best)
+
+    return content.decode('utf-8', errors='replace')
+
+
 def extract_text_from_txt(file: BinaryIO) -> str:
     """Extract text from TXT file with encoding detection."""
     try:
@@ -92,34 +164,7 @@ def extract_text_from_txt(file: BinaryIO) -> str:
         if len(content) == 0:
             raise ValueError("Text file is empty")
 
-        # Convert memoryview or bytearray to bytes first
-        if isinstance(content, memoryview):
-            content = bytes(content)
-        elif isinstance(content, bytearray):
-            content = bytes(content)
-
-        if isinstance(content, bytes):
-            # Try multiple encodings
-            encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-            decoded_content: str = ""
-
-            for encoding in encodings:
-                try:
-                    decoded_content = content.decode(encoding)
-                    break
-                except (UnicodeDecodeError, AttributeError):
-                    continue
-
-            if not decoded_content:
-                raise ValueError(
-                    "Could not decode text file with supported encodings")
-            content = decoded_content
-
-        # Ensure content is string
-        if not isinstance(content, str):
-            content = str(content)
-
-        text = content.strip()
+        text = _decode_text(content).strip()
         if not text:
             raise ValueError("Text file contains no readable content")
 
@@ -132,9 +177,7 @@ def extract_text_from_txt(file: BinaryIO) -> str:
 
 def validate_file_type(filename: str) -> bool:
     """Validate if file type is supported."""
-    allowed_extensions = {'.txt', '.pdf', '.docx'}
-    file_extension = Path(filename).suffix.lower()
-    return file_extension in allowed_extensions
+    return _file_extension(filename) in _ALLOWED_EXTS
 
 
 def get_file_mime_type(file_content: bytes, filename: str) -> Optional[str]:
@@ -143,18 +186,30 @@ def get_file_mime_type(file_content: bytes, filename: str) -> Optional[str]:
     return mime_type
 
 
-def validate_file_size(file_content: bytes, max_size_mb: int = 10) -> bool:
-    """Validate file size is within limits."""
+def validate_file_size(file_size: int, max_size_mb: int = 10) -> bool:
+    """Validate file size in bytes is within limits."""
     max_size_bytes = max_size_mb * 1024 * 1024  # Convert MB to bytes
-    return len(file_content) <= max_size_bytes
+    return file_size <= max_size_bytes
+
 
+# Text extractor for each supported extension
+_EXTRACTORS = {
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+    '.txt': extract_text_from_txt,
+}
 
-def extract_text_from_file(file_content: bytes, filename: str) -> str:
+# Supported upload extensions, checked on every upload and folder scan
+_ALLOWED_EXTS = frozenset(_EXTRACTORS)
+
+
+def extract_text_from_file(file_content: Union[bytes, BinaryIO, Path], filename: str) -> str:
     """
     Extract text from uploaded file based on extension with comprehensive validation.
 
     Args:
-        file_content: Binary file content as bytes
+        file_content: Binary file content as bytes, a binary file-like
+            object, or the path of a file to read directly
         filename: Name of the file with extension
 
     Returns:
@@ -167,28 +222,29 @@ def extract_text_from_file(file_content: bytes, filename: str) -> str:
         raise ValueError("Filename is required")
 
     # Validate file extension
-    if not validate_file_type(filename):
-        file_extension = Path(filename).suffix.lower()
+    file_extension = _file_extension(filename)
+    extractor = _EXTRACTORS.get(file_extension)
+    if extractor is None:
         raise ValueError(
             f"Unsupported file type: {file_extension}. Supported types: .txt, .pdf, .docx")
 
-    file_extension = Path(filename).suffix.lower()
-
     # Log file processing attempt
     logging.info(f"Processing file: {filename} (type: {file_extension})")
 
     try:
-        # Convert bytes to BinaryIO
-        file_like = BytesIO(file_content)
-
-        if file_extension == '.pdf':
-            return extract_text_from_pdf(file_like)
-        elif file_extension == '.docx':
-            return extract_text_from_docx(file_like)
-        elif file_extension == '.txt':
-            return extract_text_from_txt(file_like)
+        # Extractors read paths straight from disk without a bytes copy
+        if isinstance(file_content, Path):
+            with open(file_content, 'rb') as f:
+                return extractor(f)
+
+        # Convert bytes to BinaryIO; rewind file-like objects
+        if isinstance(file_content, (bytes, bytearray, memoryview)):
+            file_like = BytesIO(file_content)
         else:
-            raise ValueError(f"Unsupported file extension: {file_extension}")
+            file_like = file_content
+            file_like.seek(0)
+
+        return extractor(file_like)
     except Exception as e:
         logging.error(f"Failed to extract text from {filename}: {str(e)}")
         raise
@@ -204,47 +260,43 @@ async def process_input_folder_file(file_path: Path) -> dict:
     Returns:
         Dict containing extracted text and metadata
     """
-    if not file_path.exists():
-        raise ValueError(f"File not found: {file_path}")
-
-    if not validate_file_type(file_path.name):
+    file_extension = _file_extension(file_path.name)
+    if file_extension not in _ALLOWED_EXTS:
         raise ValueError(f"Unsupported file type: {file_path.suffix}")
 
-    # Read file content
-    with open(file_path, 'rb') as f:
-        file_content = f.read()
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {file_path}")
 
-    content = extract_text_from_file(file_content, file_path.name)
+    content = extract_text_from_file(file_path, file_path.name)
 
     return {
         "filename": file_path.name,
         "content": content,
-        "file_size": file_path.stat().st_size,
-        "modified_time": file_path.stat().st_mtime,
-        "file_type": file_path.suffix.lower()
+        "file_size": stat.st_size,
+        "modified_time": stat.st_mtime,
+        "file_type": file_extension
     }
 
 
 def scan_input_folder(input_dir):
-    """Scan input folder for supported files."""
-    from pathlib import Path
+    """Scan input folder for supported files, oldest first."""
     if not input_dir.exists():
         input_dir.mkdir(parents=True, exist_ok=True)
         return []
 
-    supported_files = []
-    for file_path in input_dir.iterdir():
-        if file_path.is_file() and validate_file_type(file_path.name):
-            supported_files.append(file_path)
+    with os.scandir(input_dir) as it:
+        entries = [(entry.stat().st_mtime, Path(entry.path))
+                   for entry in it
+                   if entry.is_file() and validate_file_type(entry.name)]
 
-    return sorted(supported_files, key=lambda x: x.stat().st_mtime)
+    entries.sort()
+    return [file_path for _, file_path in entries]
 
 
 async def save_output_file(content, output_dir, filename_prefix="rewritten_email"):
     """Save processed content to output folder."""
-    from datetime import datetime
-    from pathlib import Path
-
     if not output_dir.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -252,7 +304,8 @@ async def save_output_file(content, output_dir, filename_prefix="rewritten_email
     filename = f"{filename_prefix}_{timestamp}.txt"
     output_path = output_dir / filename
 
-    async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
-        await f.write(content)
+    # One write syscall in a worker thread instead of aiofiles' per-call
+    # thread hops and text-mode re-encoding
+    await asyncio.to_thread(output_path.write_bytes, content.encode('utf-8'))
 
     return output_path
@@ -4,15 +4,31 @@ Input folder monitoring and processing utilities for the Email Rewriter API.
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
+from cachetools import TTLCache
 from .file_handler import validate_file_type, process_input_folder_file, save_output_file
 
+try:
+    from watchfiles import Change, awatch
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+
+def _is_new_input_file(change, path: str) -> bool:
+    """Filter watchfiles events down to newly added supported files."""
+    return change == Change.added and validate_file_type(os.path.basename(path))
+
 
 class InputFolderMonitor:
     """Monitor and process files in the input folder."""
 
+    __slots__ = ('input_dir', 'output_dir', 'check_interval', '_semaphore',
+                 '_unmovable', 'logger')
+
     def __init__(self, input_dir: Path, output_dir: Path, check_interval: int = 30):
         """
         Initialize the input folder monitor.
@@ -20,12 +36,19 @@ class InputFolderMonitor:
         Args:
             input_dir: Path to input directory
             output_dir: Path to output directory
-            check_interval: How often to check for new files (seconds)
+            check_interval: How often to check for new files when
+                filesystem notifications are unavailable (seconds)
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.check_interval = check_interval
-        self.processed_files = set()
+        # Bound how many files are processed at once
+        self._semaphore = asyncio.Semaphore(
+            int(os.getenv('MONITOR_CONCURRENCY', '5')))
+        # Files that could not be moved out of the input folder; skipped so
+        # each scan does not process them again. Entries expire, so a file
+        # whose move failed transiently is retried eventually
+        self._unmovable: TTLCache = TTLCache(maxsize=1000, ttl=3600)
         self.logger = logging.getLogger(__name__)
 
         # Ensure directories exist
@@ -36,20 +59,24 @@ class InputFolderMonitor:
         """
         Scan input folder for new files to process.
 
+        Processed and failed files are moved out of the input folder, so
+        every supported file still in it is new.
+
         Returns:
             List of new file paths
         """
         if not self.input_dir.exists():
             return []
 
-        new_files = []
-        for file_path in self.input_dir.iterdir():
-            if (file_path.is_file() and
-                validate_file_type(file_path.name) and
-                    str(file_path) not in self.processed_files):
-                new_files.append(file_path)
+        # DirEntry caches its type and stat results, so each file costs at
+        # most one stat call
+        with os.scandir(self.input_dir) as it:
+            entries = [(entry.stat().st_mtime, Path(entry.path))
+                       for entry in it
+                       if entry.is_file() and validate_file_type(entry.name)]
 
-        return sorted(new_files, key=lambda x: x.stat().st_mtime)
+        entries.sort()
+        return [file_path for _, file_path in entries]
 
     async def process_file(self, file_path: Path, target_audience: str = "professional audience") -> Dict:
         """
@@ -62,15 +89,16 @@ class InputFolderMonitor:
         Returns:
             Dict with processing results
         """
-        try:
-            self.logger.info(f"Processing file: {file_path.name}")
+        async with self._semaphore:
+            try:
+                self.logger.info(f"Processing file: {file_path.name}")
 
-            # Extract text from file
-            file_data = await process_input_folder_file(file_path)
+                # Extract text from file
+                file_data = await process_input_folder_file(file_path)
 
-            # Here you would call your email rewriting service
-            # For now, we'll create a placeholder
-            processed_content = f"""
+                # Here you would call your email rewriting service
+                # For now, we'll create a placeholder
+                processed_content = f"""
 Original Email:
 {file_data['content']}
 
@@ -80,68 +108,125 @@ Processed at: {datetime.now().isoformat()}
 File: {file_data['filename']}
             """
 
-            # Save to output folder
-            output_path = await save_output_file(
-                processed_content,
-                self.output_dir,
-                f"processed_{file_path.stem}"
-            )
-
-            # Mark as processed
-            self.processed_files.add(str(file_path))
-
-            # Optionally move or delete the input file
-            processed_dir = self.input_dir / "processed"
-            processed_dir.mkdir(exist_ok=True)
-            moved_path = processed_dir / file_path.name
-            file_path.rename(moved_path)
-
-            self.logger.info(
-                f"Successfully processed {file_path.name} -> {output_path.name}")
-
-            return {
-                "status": "success",
-                "input_file": str(file_path),
-                "output_file": str(output_path),
-                "moved_to": str(moved_path),
-                "file_size": file_data['file_size'],
-                "processing_time": datetime.now().isoformat()
-            }
-
-        except Exception as e:
-            self.logger.error(f"Failed to process {file_path.name}: {str(e)}")
-
-            # Move failed file to error folder
-            error_dir = self.input_dir / "errors"
-            error_dir.mkdir(exist_ok=True)
-            error_path = error_dir / \
-                f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file_path.name}"
-            file_path.rename(error_path)
-
-            return {
-                "status": "error",
-                "input_file": str(file_path),
-                "error": str(e),
-                "moved_to": str(error_path),
-                "processing_time": datetime.now().isoformat()
-            }
+                # Save to output folder
+                output_path = await save_output_file(
+                    processed_content,
+                    self.output_dir,
+                    f"processed_{file_path.stem}"
+                )
+
+                # Optionally move or delete the input file
+                processed_dir = self.input_dir / "processed"
+                processed_dir.mkdir(exist_ok=True)
+                moved_path = processed_dir / file_path.name
+                file_path.rename(moved_path)
+
+                self.logger.info(
+                    f"Successfully processed {file_path.name} -> {output_path.name}")
+
+                return {
+                    "status": "success",
+                    "input_file": str(file_path),
+                    "output_file": str(output_path),
+                    "moved_to": str(moved_path),
+                    "file_size": file_data['file_size'],
+                    "processing_time": datetime.now().isoformat()
+                }
+
+            except Exception as e:
+                self.logger.error(f"Failed to process {file_path.name}: {str(e)}")
+
+                # Move failed file to error folder
+                error_dir = self.input_dir / "errors"
+                error_dir.mkdir(exist_ok=True)
+                error_path = error_dir / \
+                    f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file_path.name}"
+                file_path.rename(error_path)
+
+                return {
+                    "status": "error",
+                    "input_file": str(file_path),
+                    "error": str(e),
+                    "moved_to": str(error_path),
+                    "processing_time": datetime.now().isoformat()
+                }
+
+    async def process_files(self, file_paths: List[Path]):
+        """
+        Process files concurrently, bounded by MONITOR_CONCURRENCY.
+
+        Files that previously could not be moved out of the input folder
+        are skipped.
+
+        Args:
+            file_paths: Paths of the new files
+        """
+        file_paths = [file_path for file_path in file_paths
+                      if file_path not in self._unmovable]
+        if not file_paths:
+            return
+
+        self.logger.info(f"Found {len(file_paths)} new files to process")
+
+        results = await asyncio.gather(
+            *(self.process_file(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+
+        # process_file handles its own errors; an exception here means the
+        # file could not be moved to processed/ or errors/
+        for file_path, result in zip(file_paths, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Could not move {file_path.name} out of the input "
+                    f"folder, skipping it: {str(result)}")
+                self._unmovable[file_path] = True
 
     async def monitor_loop(self):
         """
-        Main monitoring loop that continuously checks for new files.
+        Main monitoring loop that processes new files as they arrive.
+
+        Uses filesystem notifications (inotify, FSEvents, ...) via watchfiles
+        when it is installed, and falls back to rescanning the folder every
+        check_interval seconds otherwise.
         """
         self.logger.info(f"Starting input folder monitoring: {self.input_dir}")
 
+        if WATCHFILES_AVAILABLE:
+            await self.watch_loop()
+        else:
+            await self.poll_loop()
+
+    async def watch_loop(self):
+        """
+        Process files as the operating system reports them added.
+        """
         while True:
             try:
-                new_files = self.scan_for_new_files()
+                # Pick up files that arrived while no watcher was running
+                await self.process_files(self.scan_for_new_files())
+
+                async for changes in awatch(
+                    self.input_dir,
+                    watch_filter=_is_new_input_file,
+                    recursive=False
+                ):
+                    new_files = sorted({Path(path) for _, path in changes})
+                    await self.process_files(
+                        [file_path for file_path in new_files
+                         if file_path.is_file()])
 
-                if new_files:
-                    self.logger.info(
-                        f"Found {len(new_files)} new files to process")
+            except Exception as e:
+                self.logger.error(f"Error in monitoring loop: {str(e)}")
+                await asyncio.sleep(self.check_interval)
 
-                    for file_path in new_files:
-                        await self.process_file(file_path)
+    async def poll_loop(self):
+        """
+        Rescan the input folder for new files every check_interval seconds.
+        """
+        while True:
+            try:
+                await self.process_files(self.scan_for_new_files())
 
                 # Wait before next check
                 await asyncio.sleep(self.check_interval)
@@ -170,21 +255,32 @@ def get_folder_stats(folder_path: Path) -> Dict:
     if not folder_path.exists():
         return {"exists": False}
 
-    files = list(folder_path.glob("**/*"))
     file_types = {}
     total_size = 0
-
-    for file_path in files:
-        if file_path.is_file():
-            ext = file_path.suffix.lower()
-            file_types[ext] = file_types.get(ext, 0) + 1
-            total_size += file_path.stat().st_size
+    total_files = total_directories = supported_files = 0
+
+    # Single walk; DirEntry types come from the directory listing, so only
+    # files need a stat call (for their size)
+    pending = [str(folder_path)]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total_directories += 1
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total_files += 1
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    file_types[ext] = file_types.get(ext, 0) + 1
+                    total_size += entry.stat().st_size
+                    if validate_file_type(entry.name):
+                        supported_files += 1
 
     return {
         "exists": True,
-        "total_files": len([f for f in files if f.is_file()]),
-        "total_directories": len([f for f in files if f.is_dir()]),
+        "total_files": total_files,
+        "total_directories": total_directories,
         "file_types": file_types,
         "total_size_mb": round(total_size / (1024 * 1024), 2),
-        "supported_files": len([f for f in files if f.is_file() and validate_file_type(f.name)])
+        "supported_files": supported_files
     }
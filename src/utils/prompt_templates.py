@@ -9,70 +9,37 @@ using Jinja2 templating engine. This approach offers:
 - Easier testing and maintenance
 """
 
-from jinja2 import Environment, Template
-from typing import Optional, List, Dict
-
-
-class PromptTemplates:
-    """
-    Centralized prompt template management using Jinja2.
-
-    Provides structured templates for different email rewriting scenarios
-    with support for variables, conditions, and formatting.
-    """
-
-    def __init__(self):
-        """Initialize Jinja2 environment with custom settings."""
-        self.env = Environment(
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from functools import lru_cache
+import os
+from typing import (
+    Any, Final, Iterator, Mapping, NamedTuple, Optional, List, Dict, Tuple, Union
+)
+
+
+class RewriteConstraints(NamedTuple):
+    """Optional limits on a rewritten email"""
+    max_length: Optional[int] = None
+    must_include: Tuple[str, ...] = ()
+    avoid: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, constraints: Mapping[str, Any]) -> 'RewriteConstraints':
+        """Build constraints from the legacy dictionary form."""
+        return cls(
+            max_length=constraints.get('max_length'),
+            must_include=tuple(constraints.get('must_include') or ()),
+            avoid=tuple(constraints.get('avoid') or ())
         )
 
-    @staticmethod
-    def get_base_system_prompt() -> str:
-        """
-        Get the base system prompt that defines the AI's role and capabilities.
 
-        Returns:
-            str: System prompt defining the AI assistant's role
-        """
-        template = Template("""
-You are an expert professional email writer and communication specialist with deep expertise in:
-- Corporate communication best practices
-- Tone and style adaptation for different audiences
-- Clear, concise, and effective writing
-- Professional email etiquette and formatting
+_NO_CONSTRAINTS: Final[RewriteConstraints] = RewriteConstraints()
 
-Your role is to rewrite emails to make them more effective, professional, and tailored to the target audience while maintaining the original intent and key information.
-""")
-        return template.render().strip()
 
-    def get_email_rewrite_prompt(
-        self,
-        email_text: str,
-        target_audience: str,
-        tone: str = "professional",
-        additional_instructions: Optional[str] = None,
-        focus_areas: Optional[List[str]] = None,
-        constraints: Optional[Dict[str, any]] = None
-    ) -> str:
-        """
-        Generate a comprehensive email rewriting prompt using Jinja2 template.
+# Prompt template sources. Each starts at its first line and ends with a
+# single newline, which Jinja drops, so renders need no strip()
 
-        Args:
-            email_text: Original email content to be rewritten
-            target_audience: Description of the target audience or context
-            tone: Desired tone (professional, casual, academic, etc.)
-            additional_instructions: Optional specific instructions
-            focus_areas: List of areas to emphasize (e.g., ["achievements", "technical skills"])
-            constraints: Dictionary of constraints (e.g., max_length, must_include)
-
-        Returns:
-            str: Formatted prompt ready for the AI model
-        """
-        template = Template("""
-## Task: Rewrite Professional Email
+_EMAIL_REWRITE_TEMPLATE = """## Task: Rewrite Professional Email
 
 ### Original Email:
 ```
@@ -83,11 +50,8 @@ Your role is to rewrite emails to make them more effective, professional, and ta
 {{ target_audience }}
 
 ### Tone Requirement:
-{{ tone|capitalize }} tone - {% if tone == "professional" %}formal, respectful, and business-appropriate
-{% elif tone == "casual" %}friendly, approachable, and conversational
-{% elif tone == "academic" %}scholarly, precise, and well-structured
-{% else %}balanced and appropriate for the context
-{% endif %}
+{{ tone_display }} tone - {{ tone_description }}
+
 
 {% if focus_areas %}
 ### Key Focus Areas:
@@ -96,16 +60,16 @@ Your role is to rewrite emails to make them more effective, professional, and ta
 {% endfor %}
 {% endif %}
 
-{% if constraints %}
+{% if has_constraints %}
 ### Constraints:
-{% if constraints.max_length %}
-- Maximum length: {{ constraints.max_length }} words
+{% if max_length %}
+- Maximum length: {{ max_length }} words
 {% endif %}
-{% if constraints.must_include %}
-- Must include: {{ constraints.must_include|join(', ') }}
+{% if must_include %}
+- Must include: {{ must_include }}
 {% endif %}
-{% if constraints.avoid %}
-- Avoid: {{ constraints.avoid|join(', ') }}
+{% if avoid %}
+- Avoid: {{ avoid }}
 {% endif %}
 {% endif %}
 
@@ -125,38 +89,9 @@ Your role is to rewrite emails to make them more effective, professional, and ta
 
 ### Output Format:
 Provide only the rewritten email content without any explanations, comments, or metadata. The output should be ready to send as-is.
-""")
-
-        return template.render(
-            email_text=email_text,
-            target_audience=target_audience,
-            tone=tone,
-            additional_instructions=additional_instructions,
-            focus_areas=focus_areas or [],
-            constraints=constraints or {}
-        ).strip()
-
-    def get_job_application_email_prompt(
-        self,
-        email_text: str,
-        job_description: str,
-        company_name: Optional[str] = None,
-        key_qualifications: Optional[List[str]] = None
-    ) -> str:
-        """
-        Specialized prompt for job application emails.
-
-        Args:
-            email_text: Original email/cover letter content
-            job_description: Full job description or key requirements
-            company_name: Name of the company (if known)
-            key_qualifications: List of key qualifications to highlight
+"""
 
-        Returns:
-            str: Formatted prompt for job application email rewriting
-        """
-        template = Template("""
-## Task: Craft Professional Job Application Email
+_JOB_APPLICATION_TEMPLATE = """## Task: Craft Professional Job Application Email
 
 ### Original Content:
 ```
@@ -197,44 +132,133 @@ Provide only the rewritten email content without any explanations, comments, or
 
 ### Output:
 Provide the complete, polished job application email ready to send.
-""")
+"""
 
-        return template.render(
-            email_text=email_text,
-            job_description=job_description,
-            company_name=company_name,
-            key_qualifications=key_qualifications or []
-        ).strip()
+_BATCH_REWRITE_JSON_TEMPLATE = """## Task: Rewrite Multiple Emails
 
-    def get_follow_up_email_prompt(
-        self,
-        email_text: str,
-        context: str,
-        tone: str = "professional"
-    ) -> str:
-        """
-        Generate prompt for follow-up emails.
+### Target Audience/Context:
+{{ target_audience }}
 
-        Args:
-            email_text: Original follow-up email draft
-            context: Context about previous communication
-            tone: Desired tone
+### Tone: {{ tone_display }}
 
-        Returns:
-            str: Formatted prompt for follow-up email
-        """
-        template = Template("""
-## Task: Craft Effective Follow-Up Email
+### Emails to Rewrite:
+
+{{ emails }}
+
+### Guidelines:
+1. Rewrite each email independently for the target audience and tone
+2. Maintain the core message and intent of each original email
+3. Ensure appropriate greeting, closing, and paragraph structure
+
+### Output Format:
+Respond with a JSON object of the form {"emails": [{"id": 1, "rewritten": "..."}]} containing exactly one entry per email, where "id" is the email number above and "rewritten" is the complete rewritten email ready to send. Do not include any other text.
+"""
+
+# Static system prompt; it takes no variables, so it needs no template
+_BASE_SYSTEM_PROMPT: Final[str] = """You are an expert professional email writer and communication specialist with deep expertise in:
+- Corporate communication best practices
+- Tone and style adaptation for different audiences
+- Clear, concise, and effective writing
+- Professional email etiquette and formatting
+
+Your role is to rewrite emails to make them more effective, professional, and tailored to the target audience while maintaining the original intent and key information."""
+
+# Text of the batch processing prompt after its email list
+_BATCH_PROCESSING_FOOTER: Final[str] = """
+
+### Instructions:
+1. Rewrite each email according to the common context and tone
+2. Maintain consistency across all emails
+3. Number each rewritten email clearly
+4. Ensure each email is complete and ready to send
+
+### Output Format:
+For each email, provide:
+
+**Rewritten Email [number]:**
+[Complete rewritten content]
+
+---"""
+
+# Descriptions spelled out after the tone name in the rewrite prompt
+_TONE_DESCRIPTIONS: Final[Dict[str, str]] = {
+    "professional": "formal, respectful, and business-appropriate",
+    "casual": "friendly, approachable, and conversational",
+    "academic": "scholarly, precise, and well-structured",
+}
+_DEFAULT_TONE_DESCRIPTION: Final[str] = "balanced and appropriate for the context"
+
+# Sources registered with the shared environment's loader, by template name
+_TEMPLATE_SOURCES: Final[Dict[str, str]] = {
+    'email_rewrite': _EMAIL_REWRITE_TEMPLATE,
+    'job_application': _JOB_APPLICATION_TEMPLATE,
+    'batch_rewrite_json': _BATCH_REWRITE_JSON_TEMPLATE,
+}
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Get the on-disk cache of compiled templates shared across processes.
+
+    By default Jinja keeps the cache in a per-user directory that it creates
+    with 0700 permissions and verifies ownership of, so other local users
+    cannot plant bytecode. PROMPT_TEMPLATE_CACHE overrides the directory;
+    an empty value, or a directory that cannot be written, disables it.
+
+    Returns:
+        FileSystemBytecodeCache or None when caching is disabled
+    """
+    cache_dir = os.getenv('PROMPT_TEMPLATE_CACHE')
+    if cache_dir is None:
+        try:
+            return FileSystemBytecodeCache()
+        except (OSError, RuntimeError):
+            return None
+    if not cache_dir:
+        return None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(cache_dir, '%s.cache')
+
+
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """
+    Get the shared Jinja2 environment, building it on first use.
+
+    Templates never change at runtime, so reload checks are off and every
+    template stays in the cache once compiled by get_template(). Compiled
+    bytecode is also kept on disk, so new worker processes skip parsing.
+
+    Returns:
+        Environment: Environment that loads templates by name
+    """
+    return Environment(
+        loader=DictLoader(_TEMPLATE_SOURCES),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_bytecode_cache()
+    )
+
+
+# Prompts without conditions or loops are plain f-strings
+def _follow_up_prompt(email_text: str, context: str, tone_display: str) -> str:
+    """Build the follow-up email prompt."""
+    return f"""## Task: Craft Effective Follow-Up Email
 
 ### Original Draft:
 ```
-{{ email_text }}
+{email_text}
 ```
 
 ### Context/Previous Communication:
-{{ context }}
+{context}
 
-### Tone: {{ tone|capitalize }}
+### Tone: {tone_display}
 
 ### Follow-Up Best Practices:
 1. **Reference Previous Communication**: Clearly reference the original conversation/email
@@ -246,31 +270,16 @@ Provide the complete, polished job application email ready to send.
 7. **Timing Acknowledgment**: Acknowledge appropriate timing
 
 ### Output:
-Provide the complete, polished follow-up email.
-""")
+Provide the complete, polished follow-up email."""
 
-        return template.render(
-            email_text=email_text,
-            context=context,
-            tone=tone
-        ).strip()
-
-    def get_email_summary_prompt(self, email_text: str) -> str:
-        """
-        Generate prompt for email summarization.
-
-        Args:
-            email_text: Email content to summarize
 
-        Returns:
-            str: Formatted prompt for summarization
-        """
-        template = Template("""
-## Task: Summarize Email Content
+def _email_summary_prompt(email_text: str) -> str:
+    """Build the email summary prompt."""
+    return f"""## Task: Summarize Email Content
 
 ### Email to Summarize:
 ```
-{{ email_text }}
+{email_text}
 ```
 
 ### Summarization Requirements:
@@ -283,10 +292,176 @@ Provide the complete, polished follow-up email.
 ### Output Format:
 **Summary:** [Main message]
 **Action Items:** [List if applicable, or "None"]
-**Key Dates:** [List if applicable, or "None"]
-""")
+**Key Dates:** [List if applicable, or "None"]"""
+
 
-        return template.render(email_text=email_text).strip()
+def _email_list_item(index: int, email: str) -> str:
+    """Render one numbered, fenced email of the batch templates' list."""
+    return f"\n#### Email {index}:\n```\n{email}\n```\n\n"
+
+
+def _batch_processing_parts(
+    email_texts: List[str],
+    common_context: str,
+    tone_display: str
+) -> Iterator[str]:
+    """Yield the batch processing prompt piece by piece, one per email."""
+    yield f"""## Task: Batch Process Multiple Emails
+
+### Common Context/Audience:
+{common_context}
+
+### Tone: {tone_display}
+
+### Emails to Process:
+
+"""
+    for index, email in enumerate(email_texts, 1):
+        yield _email_list_item(index, email)
+    yield _BATCH_PROCESSING_FOOTER
+
+
+def _render_email_list(email_texts: List[str]) -> str:
+    """Render the numbered email list of the batch templates."""
+    return "".join([_email_list_item(index, email)
+                    for index, email in enumerate(email_texts, 1)])
+
+
+def _join_values(values: Any) -> str:
+    """Join constraint values into a comma-separated string."""
+    return ", ".join(map(str, values)) if values else ""
+
+
+class PromptTemplates:
+    """
+    Centralized prompt template management using Jinja2.
+
+    Provides structured templates for different email rewriting scenarios
+    with support for variables, conditions, and formatting.
+    """
+
+    def __init__(self):
+        """Use the shared Jinja2 environment holding the compiled templates."""
+        self.env = get_template_env()
+
+    @staticmethod
+    def get_base_system_prompt() -> str:
+        """
+        Get the base system prompt that defines the AI's role and capabilities.
+
+        Returns:
+            str: System prompt defining the AI assistant's role
+        """
+        return _BASE_SYSTEM_PROMPT
+
+    def get_email_rewrite_prompt(
+        self,
+        email_text: str,
+        target_audience: str,
+        tone: str = "professional",
+        additional_instructions: Optional[str] = None,
+        focus_areas: Optional[List[str]] = None,
+        constraints: Optional[
+            Union[RewriteConstraints, Mapping[str, Any]]] = None
+    ) -> str:
+        """
+        Generate a comprehensive email rewriting prompt using Jinja2 template.
+
+        Args:
+            email_text: Original email content to be rewritten
+            target_audience: Description of the target audience or context
+            tone: Desired tone (professional, casual, academic, etc.)
+            additional_instructions: Optional specific instructions
+            focus_areas: List of areas to emphasize (e.g., ["achievements", "technical skills"])
+            constraints: RewriteConstraints (or a legacy dict with max_length,
+                must_include and avoid keys)
+
+        Returns:
+            str: Formatted prompt ready for the AI model
+        """
+        if constraints is not None and not isinstance(
+                constraints, RewriteConstraints):
+            constraints = RewriteConstraints.from_dict(constraints)
+
+        # Resolve optional sections here so the template only tests flat values
+        has_constraints = constraints is not None and any(constraints)
+        if constraints is None:
+            constraints = _NO_CONSTRAINTS
+
+        template = self.env.get_template('email_rewrite')
+
+        return template.render(
+            email_text=email_text,
+            target_audience=target_audience,
+            tone_display=tone.capitalize(),
+            tone_description=_TONE_DESCRIPTIONS.get(
+                tone, _DEFAULT_TONE_DESCRIPTION),
+            additional_instructions=additional_instructions,
+            focus_areas=focus_areas or (),
+            has_constraints=has_constraints,
+            max_length=constraints.max_length,
+            must_include=_join_values(constraints.must_include),
+            avoid=_join_values(constraints.avoid)
+        )
+
+    def get_job_application_email_prompt(
+        self,
+        email_text: str,
+        job_description: str,
+        company_name: Optional[str] = None,
+        key_qualifications: Optional[List[str]] = None
+    ) -> str:
+        """
+        Specialized prompt for job application emails.
+
+        Args:
+            email_text: Original email/cover letter content
+            job_description: Full job description or key requirements
+            company_name: Name of the company (if known)
+            key_qualifications: List of key qualifications to highlight
+
+        Returns:
+            str: Formatted prompt for job application email rewriting
+        """
+        template = self.env.get_template('job_application')
+
+        return template.render(
+            email_text=email_text,
+            job_description=job_description,
+            company_name=company_name,
+            key_qualifications=key_qualifications or ()
+        )
+
+    def get_follow_up_email_prompt(
+        self,
+        email_text: str,
+        context: str,
+        tone: str = "professional"
+    ) -> str:
+        """
+        Generate prompt for follow-up emails.
+
+        Args:
+            email_text: Original follow-up email draft
+            context: Context about previous communication
+            tone: Desired tone
+
+        Returns:
+            str: Formatted prompt for follow-up email
+        """
+        return _follow_up_prompt(email_text, context, tone.capitalize())
+
+    def get_email_summary_prompt(self, email_text: str) -> str:
+        """
+        Generate prompt for email summarization.
+
+        Args:
+            email_text: Email content to summarize
+
+        Returns:
+            str: Formatted prompt for summarization
+        """
+        return _email_summary_prompt(email_text)
 
     def get_batch_processing_prompt(
         self,
@@ -305,45 +480,41 @@ Provide the complete, polished follow-up email.
         Returns:
             str: Formatted prompt for batch processing
         """
-        template = Template("""
-## Task: Batch Process Multiple Emails
-
-### Common Context/Audience:
-{{ common_context }}
-
-### Tone: {{ tone|capitalize }}
-
-### Emails to Process:
-
-{% for email in email_texts %}
-#### Email {{ loop.index }}:
-```
-{{ email }}
-```
-
-{% endfor %}
-
-### Instructions:
-1. Rewrite each email according to the common context and tone
-2. Maintain consistency across all emails
-3. Number each rewritten email clearly
-4. Ensure each email is complete and ready to send
+        return "".join(_batch_processing_parts(
+            email_texts, common_context, tone.capitalize()))
 
-### Output Format:
-For each email, provide:
+    def get_batch_rewrite_json_prompt(
+        self,
+        email_texts: List[str],
+        target_audience: str,
+        tone: str = "professional"
+    ) -> str:
+        """
+        Generate prompt for rewriting several emails in one request with JSON output.
 
-**Rewritten Email {{ loop.index }}:**
-[Complete rewritten content]
+        Args:
+            email_texts: List of email contents to rewrite
+            target_audience: Common target audience or context
+            tone: Desired tone
 
----
-""")
+        Returns:
+            str: Formatted prompt requesting a JSON object of rewritten emails
+        """
+        template = self.env.get_template('batch_rewrite_json')
 
         return template.render(
-            email_texts=email_texts,
-            common_context=common_context,
-            tone=tone
-        ).strip()
+            emails=_render_email_list(email_texts),
+            target_audience=target_audience,
+            tone_display=tone.capitalize()
+        )
+
 
+@lru_cache(maxsize=None)
+def get_prompt_templates() -> PromptTemplates:
+    """
+    Get the shared PromptTemplates instance, creating it on first use.
 
-# Singleton instance for easy import
-prompt_templates = PromptTemplates()
+    Returns:
+        PromptTemplates: Process-wide prompt template manager
+    """
+    return PromptTemplates()
@@ -0,0 +1,73 @@
+"""
+Shared test fixtures. The application modules import each other from src/.
+"""
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# The app reads its settings at import; tests never reach OpenAI
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api.rate_limiter import RateLimiter  # noqa: E402
+from services import (  # noqa: E402
+    EmailServiceInterface, ResponseCache, RewriteResult
+)
+
+
+class FakeEmailService(EmailServiceInterface):
+    """Email service that answers without calling OpenAI."""
+
+    __slots__ = ('calls',)
+    model = "gpt-4o-mini"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def rewrite_email(self, email_text, target_audience,
+                            tone="professional", focus_areas=None,
+                            additional_instructions=None):
+        self.calls += 1
+        return RewriteResult("Rewritten email", 5, 3, 2, 0.001, self.model)
+
+
+@pytest.fixture
+def email_service():
+    """Fake email service that counts its calls."""
+    return FakeEmailService()
+
+
+@pytest.fixture
+def app_module():
+    """The api.app module; the api package re-exports its FastAPI object."""
+    return importlib.import_module("api.app")
+
+
+@pytest.fixture
+def api_client(monkeypatch, app_module, email_service):
+    """Test client with a fake email service, an empty response cache and
+    a rate limit tests do not reach."""
+    monkeypatch.setattr(app_module, "rate_limiter",
+                        RateLimiter(requests=1000, period=60))
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    app = app_module.app
+    app.dependency_overrides[app_module.get_email_service] = \
+        lambda: email_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def rewrite_body():
+    """Valid /rewrite request body."""
+    return {
+        "email_text": ("Hi team, the quarterly report is attached. Please "
+                       "review it before Friday."),
+        "target_audience": "Engineering managers"
+    }
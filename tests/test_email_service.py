@@ -0,0 +1,112 @@
+"""
+Tests for batched email rewriting.
+"""
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from services import EmailService
+
+EMAILS = ["First email text", "Second email text"]
+
+
+def completion(content, finish_reason="stop"):
+    """Chat completion with the given content and fixed usage."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(
+            finish_reason=finish_reason,
+            message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(
+            total_tokens=100, prompt_tokens=60, completion_tokens=40)
+    )
+
+
+class FakeCompletions:
+    """Chat completions endpoint that answers batch and single requests."""
+
+    def __init__(self, batch_response):
+        self.batch_response = batch_response
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if "response_format" in kwargs:
+            return self.batch_response
+        return completion("Single rewrite")
+
+
+def make_service(batch_response):
+    """EmailService whose client returns batch_response for batches."""
+    completions = FakeCompletions(batch_response)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return EmailService(client=client), completions
+
+
+def batch_json(*rewrites):
+    """JSON-mode batch response content for the given rewrites."""
+    return orjson.dumps({"emails": [
+        {"id": index, "rewritten": rewrite}
+        for index, rewrite in enumerate(rewrites, 1)
+    ]}).decode()
+
+
+class TestRewriteEmailBatch:
+    """Test the batched JSON request and its per-email fallback."""
+
+    @pytest.mark.asyncio
+    async def test_parses_rewrites_in_order(self):
+        """One request returns every rewrite, splitting usage evenly."""
+        service, completions = make_service(
+            completion(batch_json("First rewrite", "Second rewrite")))
+
+        results = await service.rewrite_email_batch(EMAILS, "Team leads")
+
+        assert [result.content for result in results] == [
+            "First rewrite", "Second rewrite"]
+        assert [result.total_tokens for result in results] == [50, 50]
+        assert len(completions.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_output_budget_scales_with_batch(self):
+        """Each email gets the single-rewrite max_tokens."""
+        service, completions = make_service(
+            completion(batch_json("First rewrite", "Second rewrite")))
+
+        await service.rewrite_email_batch(EMAILS, "Team leads")
+
+        assert completions.requests[0]["max_tokens"] == \
+            service.max_tokens * len(EMAILS)
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_falls_back(self):
+        """A response cut off at max_tokens is rewritten per email."""
+        truncated = batch_json("First rewrite", "Second rewrite")[:30]
+        service, completions = make_service(
+            completion(truncated, finish_reason="length"))
+
+        results = await service.rewrite_email_batch(EMAILS, "Team leads")
+
+        assert [result.content for result in results] == [
+            "Single rewrite", "Single rewrite"]
+        assert len(completions.requests) == 1 + len(EMAILS)
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_falls_back(self):
+        """Unparseable content is rewritten per email."""
+        service, _ = make_service(completion('{"emails": ['))
+
+        results = await service.rewrite_email_batch(EMAILS, "Team leads")
+
+        assert [result.content for result in results] == [
+            "Single rewrite", "Single rewrite"]
+
+    @pytest.mark.asyncio
+    async def test_missing_rewrite_falls_back(self):
+        """A response without every email is rewritten per email."""
+        service, _ = make_service(completion(batch_json("First rewrite")))
+
+        results = await service.rewrite_email_batch(EMAILS, "Team leads")
+
+        assert [result.content for result in results] == [
+            "Single rewrite", "Single rewrite"]
@@ -0,0 +1,66 @@
+"""
+Tests for the per-client token bucket rate limiter.
+"""
+import pytest
+
+from api.exceptions import APIRateLimitError
+from api.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test token bucket accounting."""
+
+    def test_allows_up_to_capacity(self):
+        """A full bucket serves capacity requests, then rejects."""
+        bucket = TokenBucket(rate=1 / 60, capacity=3)
+        for _ in range(3):
+            bucket.take()
+        with pytest.raises(APIRateLimitError):
+            bucket.take()
+
+    def test_retry_after_is_time_to_next_token(self):
+        """The rejection reports whole seconds until a token is back."""
+        bucket = TokenBucket(rate=1 / 60, capacity=1)
+        bucket.take()
+        with pytest.raises(APIRateLimitError) as exc_info:
+            bucket.take()
+        assert 59 <= exc_info.value.retry_after <= 60
+
+    def test_refills_over_time(self):
+        """Elapsed time adds tokens back."""
+        bucket = TokenBucket(rate=1 / 60, capacity=1)
+        bucket.take()
+        bucket.last_refill -= 60
+        bucket.take()
+
+
+class TestRateLimiter:
+    """Test per-client buckets."""
+
+    def test_clients_have_separate_buckets(self):
+        """One client running out does not limit another."""
+        limiter = RateLimiter(requests=1, period=60)
+        limiter.acquire("10.0.0.1")
+        with pytest.raises(APIRateLimitError):
+            limiter.acquire("10.0.0.1")
+        limiter.acquire("10.0.0.2")
+
+
+class TestRateLimitEndpoint:
+    """Test the 429 response of rate-limited endpoints."""
+
+    def test_returns_429_with_retry_after(self, api_client, app_module,
+                                          monkeypatch, rewrite_body):
+        """The request after the bucket empties gets 429 and Retry-After."""
+        monkeypatch.setattr(app_module, "rate_limiter",
+                            RateLimiter(requests=1, period=60))
+
+        response = api_client.post("/rewrite", json=rewrite_body)
+        assert response.status_code == 200
+
+        response = api_client.post("/rewrite", json=rewrite_body)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "60"
+        detail = response.json()["detail"]
+        assert detail["error_code"] == "RATE_LIMIT_EXCEEDED"
+        assert detail["retry_after"] == 60
@@ -0,0 +1,76 @@
+"""
+Tests for the exact-match response cache.
+"""
+import pytest
+
+from services import ResponseCache, RewriteResult
+
+RESULT = RewriteResult("Rewritten email", 5, 3, 2, 0.001, "gpt-4o-mini")
+
+
+def make_key(email_text="Hello team", tone="professional"):
+    """Cache key for a request that varies only in text and tone."""
+    return ResponseCache.key(
+        email_text, "Engineering managers", tone, None, None, "gpt-4o-mini")
+
+
+class TestResponseCacheKey:
+    """Test cache key normalization."""
+
+    def test_ignores_whitespace_and_case(self):
+        """Reformatted text maps to the same key."""
+        assert make_key("Hello   team\n") == make_key("hello team")
+
+    def test_differs_by_tone(self):
+        """Requests for another tone are cached separately."""
+        assert make_key(tone="casual") != make_key(tone="professional")
+
+
+class TestResponseCache:
+    """Test hit and miss accounting."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        """A lookup misses until the result is stored, then hits."""
+        cache = ResponseCache()
+        key = make_key()
+
+        assert await cache.get(key) is None
+        await cache.set(key, RESULT)
+        assert await cache.get(key) == RESULT
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+
+class TestRewriteEndpointCache:
+    """Test /rewrite served from the response cache."""
+
+    def test_repeated_request_is_a_hit(self, api_client, email_service,
+                                       rewrite_body):
+        """The second identical request skips the email service."""
+        first = api_client.post("/rewrite", json=rewrite_body).json()
+        second = api_client.post("/rewrite", json=rewrite_body).json()
+
+        assert email_service.calls == 1
+        assert first["metadata"]["cache"] == "miss"
+        assert second["metadata"]["cache"] == "hit"
+        assert second["rewritten_email"] == first["rewritten_email"]
+
+    def test_hit_reports_no_usage(self, api_client, rewrite_body):
+        """A cache hit made no OpenAI call, so it reports no tokens or cost."""
+        api_client.post("/rewrite", json=rewrite_body)
+        metadata = api_client.post("/rewrite", json=rewrite_body).json()[
+            "metadata"]
+
+        assert metadata["tokens_used"] == 0
+        assert metadata["cost_usd"] == 0
+
+    def test_cache_false_bypasses(self, api_client, email_service,
+                                  rewrite_body):
+        """?cache=false always calls the email service."""
+        api_client.post("/rewrite?cache=false", json=rewrite_body)
+        response = api_client.post("/rewrite?cache=false", json=rewrite_body)
+
+        assert email_service.calls == 2
+        assert response.json()["metadata"]["cache"] == "bypass"
@@ -0,0 +1,82 @@
+"""
+Tests for the semantic response cache.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from services import RewriteResult, SemanticCache
+
+RESULT = RewriteResult("Rewritten email", 5, 3, 2, 0.001, "gpt-4o-mini")
+
+
+class FakeEmbeddings:
+    """Embeddings endpoint returning a fixed vector per text."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    async def create(self, model, input, dimensions):
+        self.calls += 1
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=self.vectors[input])])
+
+
+@pytest.fixture
+def embeddings():
+    """Vectors for an email, a near-duplicate and an unrelated email."""
+    return FakeEmbeddings({
+        "original": [1.0, 0.0],
+        "near duplicate": [0.999, 0.01],
+        "unrelated": [0.0, 1.0],
+    })
+
+
+@pytest.fixture
+def cache(monkeypatch, embeddings):
+    """Enabled semantic cache backed by the fake embeddings."""
+    monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "true")
+    return SemanticCache(client=SimpleNamespace(embeddings=embeddings))
+
+
+class TestSemanticCache:
+    """Test near-duplicate lookups."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_hits(self, cache):
+        """An email embedded close to a stored one returns its result."""
+        result, embedding = await cache.lookup("ns", "original")
+        assert result is None
+        await cache.store("ns", embedding, RESULT)
+
+        result, _ = await cache.lookup("ns", "near duplicate")
+        assert result == RESULT
+
+    @pytest.mark.asyncio
+    async def test_distant_email_misses(self, cache):
+        """An unrelated email does not return the stored result."""
+        _, embedding = await cache.lookup("ns", "original")
+        await cache.store("ns", embedding, RESULT)
+
+        result, _ = await cache.lookup("ns", "unrelated")
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_separate(self, cache):
+        """A result stored for one audience and tone is not served to another."""
+        _, embedding = await cache.lookup("ns", "original")
+        await cache.store("ns", embedding, RESULT)
+
+        result, _ = await cache.lookup("other", "original")
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_skips_embedding(self, monkeypatch,
+                                                  embeddings):
+        """A disabled cache makes no embedding call."""
+        monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "false")
+        cache = SemanticCache(client=SimpleNamespace(embeddings=embeddings))
+
+        assert await cache.lookup("ns", "original") == (None, None)
+        assert embeddings.calls == 0